@@ -0,0 +1,25 @@
+"""composite indexes for keyset pagination of history endpoints
+
+Revision ID: 0002_history_keyset_indexes
+Revises: 0001_initial
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_history_keyset_indexes'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reviews_user_id_timestamp_id', 'reviews', ['user_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_job_matches_user_id_timestamp_id', 'job_matches', ['user_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_matches_user_id_timestamp_id', table_name='job_matches')
+    op.drop_index('ix_reviews_user_id_timestamp_id', table_name='reviews')
@@ -0,0 +1,79 @@
+"""content-addressed resume_documents shared by reviews and matches
+
+Revision ID: 0003_resume_documents
+Revises: 0002_history_keyset_indexes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_resume_documents'
+down_revision = '0002_history_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    documents = op.create_table('resume_documents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('raw_text', sa.Text(), nullable=True),
+    sa.Column('parsed_resume', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_resume_documents_content_hash'), 'resume_documents', ['content_hash'], unique=True)
+    op.create_index(op.f('ix_resume_documents_id'), 'resume_documents', ['id'], unique=False)
+
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.add_column(sa.Column('document_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_reviews_document_id', 'resume_documents', ['document_id'], ['id'])
+        batch_op.create_index(batch_op.f('ix_reviews_document_id'), ['document_id'], unique=False)
+    with op.batch_alter_table('job_matches') as batch_op:
+        batch_op.add_column(sa.Column('document_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_job_matches_document_id', 'resume_documents', ['document_id'], ['id'])
+        batch_op.create_index(batch_op.f('ix_job_matches_document_id'), ['document_id'], unique=False)
+
+    # Backfill: existing reviews only kept the extracted text, so key them by a hash of
+    # that text (uploads are keyed by PDF bytes; the two can't collide in practice)
+    conn = op.get_bind()
+    reviews = sa.table('reviews',
+        sa.column('id', sa.Integer), sa.column('raw_text', sa.Text),
+        sa.column('parsed_resume', sa.JSON), sa.column('timestamp', sa.DateTime),
+        sa.column('document_id', sa.Integer),
+    )
+    doc_ids = {}
+    rows = conn.execute(
+        sa.select(reviews.c.id, reviews.c.raw_text, reviews.c.parsed_resume, reviews.c.timestamp)
+        .where(reviews.c.raw_text.isnot(None))
+        .order_by(reviews.c.id)
+    ).all()
+    for row in rows:
+        digest = hashlib.sha256(row.raw_text.encode('utf-8')).hexdigest()
+        if digest not in doc_ids:
+            doc_ids[digest] = conn.execute(
+                documents.insert().values(
+                    content_hash=digest, raw_text=row.raw_text,
+                    parsed_resume=row.parsed_resume, created_at=row.timestamp,
+                ).returning(documents.c.id)
+            ).scalar_one()
+        conn.execute(reviews.update().where(reviews.c.id == row.id).values(document_id=doc_ids[digest]))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_matches') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_job_matches_document_id'))
+        batch_op.drop_constraint('fk_job_matches_document_id', type_='foreignkey')
+        batch_op.drop_column('document_id')
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_reviews_document_id'))
+        batch_op.drop_constraint('fk_reviews_document_id', type_='foreignkey')
+        batch_op.drop_column('document_id')
+    op.drop_index(op.f('ix_resume_documents_id'), table_name='resume_documents')
+    op.drop_index(op.f('ix_resume_documents_content_hash'), table_name='resume_documents')
+    op.drop_table('resume_documents')
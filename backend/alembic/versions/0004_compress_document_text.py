@@ -0,0 +1,60 @@
+"""store full resume text zlib-compressed with a preview column
+
+Revision ID: 0004_compress_document_text
+Revises: 0003_resume_documents
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_compress_document_text'
+down_revision = '0003_resume_documents'
+branch_labels = None
+depends_on = None
+
+PREVIEW_LENGTH = 500
+
+documents = sa.table('resume_documents',
+    sa.column('id', sa.Integer),
+    sa.column('raw_text', sa.Text),
+    sa.column('text_compressed', sa.LargeBinary),
+    sa.column('text_preview', sa.String),
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('resume_documents') as batch_op:
+        batch_op.add_column(sa.Column('text_compressed', sa.LargeBinary(), nullable=True))
+        batch_op.add_column(sa.Column('text_preview', sa.String(length=PREVIEW_LENGTH), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(documents.c.id, documents.c.raw_text).where(documents.c.raw_text.isnot(None))).all()
+    for row in rows:
+        conn.execute(documents.update().where(documents.c.id == row.id).values(
+            text_compressed=zlib.compress(row.raw_text.encode('utf-8')),
+            text_preview=' '.join(row.raw_text[:PREVIEW_LENGTH * 2].split())[:PREVIEW_LENGTH],
+        ))
+
+    with op.batch_alter_table('resume_documents') as batch_op:
+        batch_op.drop_column('raw_text')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('resume_documents') as batch_op:
+        batch_op.add_column(sa.Column('raw_text', sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(documents.c.id, documents.c.text_compressed).where(documents.c.text_compressed.isnot(None))).all()
+    for row in rows:
+        conn.execute(documents.update().where(documents.c.id == row.id).values(
+            raw_text=zlib.decompress(row.text_compressed).decode('utf-8'),
+        ))
+
+    with op.batch_alter_table('resume_documents') as batch_op:
+        batch_op.drop_column('text_preview')
+        batch_op.drop_column('text_compressed')
@@ -0,0 +1,42 @@
+"""saved job profiles with precomputed keywords, skills and embedding
+
+Revision ID: 0005_job_profiles
+Revises: 0004_compress_document_text
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_job_profiles'
+down_revision = '0004_compress_document_text'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('job_profiles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('keywords', sa.JSON(), nullable=True),
+    sa.Column('skills', sa.JSON(), nullable=True),
+    sa.Column('prompt_excerpt', sa.Text(), nullable=True),
+    sa.Column('embedding', sa.LargeBinary(), nullable=True),
+    sa.Column('embedding_model', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_profiles_id'), 'job_profiles', ['id'], unique=False)
+    op.create_index('ix_job_profiles_user_id_created_at_id', 'job_profiles', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_profiles_user_id_created_at_id', table_name='job_profiles')
+    op.drop_index(op.f('ix_job_profiles_id'), table_name='job_profiles')
+    op.drop_table('job_profiles')
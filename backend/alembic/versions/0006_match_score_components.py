@@ -0,0 +1,31 @@
+"""store keyword / AI components of job_matches.match_score and the weight used
+
+Revision ID: 0006_match_score_components
+Revises: 0005_job_profiles
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_match_score_components'
+down_revision = '0005_job_profiles'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows only have the blended score; their components stay NULL
+    with op.batch_alter_table('job_matches') as batch_op:
+        batch_op.add_column(sa.Column('keyword_score', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('ai_score', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('score_weight', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_matches') as batch_op:
+        batch_op.drop_column('score_weight')
+        batch_op.drop_column('ai_score')
+        batch_op.drop_column('keyword_score')
@@ -0,0 +1,31 @@
+"""updated_at on reviews and job_matches for history validators
+
+Revision ID: 0007_history_updated_at
+Revises: 0006_match_score_components
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_history_updated_at'
+down_revision = '0006_match_score_components'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('reviews', 'job_matches'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(sa.text(f'UPDATE {table} SET updated_at = timestamp'))
+        op.create_index(f'ix_{table}_user_id_updated_at', table, ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    for table in ('job_matches', 'reviews'):
+        op.drop_index(f'ix_{table}_user_id_updated_at', table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,19 @@
+"""
+Performance benchmarks. Run a suite with `python -m benchmarks.run` from backend/
+(or one module with `python -m benchmarks.<name>`).
+
+Importing the package fills in any settings the app needs that are missing from
+the environment / .env: a throwaway SQLite database, a dummy SECRET_KEY and a
+dummy GROQ_API_KEY (LLM calls go to benchmarks.fake_groq).
+"""
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='resume-bench-'), 'bench.db')}"
+)
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
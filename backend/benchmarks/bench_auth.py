@@ -0,0 +1,82 @@
+"""
+Login throughput under a login storm, and its effect on other authenticated traffic.
+
+Drives the real /auth/login and /history handlers in-process (httpx + ASGI) with
+`--logins` concurrent logins while `--readers` clients poll /history, then reports
+logins/second plus login and /history latency percentiles.
+
+Compare work factors and hashing pool sizes, e.g.:
+
+    BCRYPT_ROUNDS=12 BCRYPT_MAX_CONCURRENCY=2 python -m benchmarks.bench_auth
+    BCRYPT_ROUNDS=10 BCRYPT_MAX_CONCURRENCY=4 python -m benchmarks.bench_auth
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from benchmarks.common import percentiles
+from config import get_settings
+from main import app
+from models.db import async_engine, init_db
+
+EMAIL = "bench-login@example.com"
+PASSWORD = "bench-password"
+
+
+async def main(args) -> dict:
+    init_db()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/auth/signup", json={"email": EMAIL, "password": PASSWORD})
+        login_form = {"username": EMAIL, "password": PASSWORD}
+        token = (await client.post("/auth/login", data=login_form)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        login_times, history_times, errors = [], [], 0
+        done = asyncio.Event()
+
+        async def login_worker(n: int):
+            nonlocal errors
+            for _ in range(n):
+                start = time.perf_counter()
+                r = await client.post("/auth/login", data=login_form)
+                login_times.append(time.perf_counter() - start)
+                errors += r.status_code != 200
+
+        async def reader():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/history", headers=headers)
+                history_times.append(time.perf_counter() - start)
+
+        readers = [asyncio.create_task(reader()) for _ in range(args.readers)]
+        per_worker = max(1, args.logins // args.concurrency)
+        start = time.perf_counter()
+        await asyncio.gather(*(login_worker(per_worker) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await asyncio.gather(*readers)
+
+    await async_engine.dispose()
+    settings = get_settings()
+    return {
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "hashing_threads": settings.BCRYPT_MAX_CONCURRENCY,
+        "logins": len(login_times),
+        "errors": errors,
+        "logins_per_second": round(len(login_times) / elapsed, 1),
+        "login_latency": percentiles(login_times),
+        "history_requests": len(history_times),
+        "history_latency": percentiles(history_times),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--readers", type=int, default=5)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
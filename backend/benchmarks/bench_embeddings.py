@@ -0,0 +1,70 @@
+"""
+EmbeddingsService index add/search at 10k-1M vectors.
+
+Index timings use random unit vectors (model-independent); if the embedding model
+can be loaded, encode throughput through the micro-batcher is measured as well.
+Requires sentence-transformers and faiss-cpu.
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ["ENABLE_EMBEDDINGS"] = "true"
+
+from benchmarks.common import percentiles  # noqa: E402
+from services import embeddings_service  # noqa: E402
+
+DIMENSION = 384  # all-MiniLM-L6-v2
+
+
+def run(quick: bool = False) -> dict:
+    if not embeddings_service.EMBEDDINGS_ENABLED:
+        return {"skipped": "sentence-transformers / faiss-cpu not installed"}
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    results = {}
+    for size in (10_000, 100_000) if quick else (10_000, 100_000, 1_000_000):
+        service = embeddings_service.EmbeddingsService()
+        service.dimension = DIMENSION
+        service.index = embeddings_service.faiss.IndexFlatIP(DIMENSION)
+        vectors = rng.standard_normal((size, DIMENSION), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        start = time.perf_counter()
+        for i in range(0, size, 10_000):
+            service._add_vectors(list(range(i, min(i + 10_000, size))), vectors[i:i + 10_000])
+        add_seconds = time.perf_counter() - start
+
+        queries = rng.standard_normal((50, DIMENSION), dtype=np.float32)
+        timings = []
+        for q in queries:
+            start = time.perf_counter()
+            service._search_vector(q / np.linalg.norm(q), 15)
+            timings.append(time.perf_counter() - start)
+        results[f"vectors_{size}"] = {
+            "add_vectors_per_s": round(size / add_seconds),
+            "search": percentiles(timings),
+        }
+        service.close()
+
+    service = embeddings_service.EmbeddingsService()
+    texts = [f"python developer with {i} years of experience" for i in range(256 if quick else 2048)]
+    try:
+        service.batcher.encode(texts[0])  # loads the model
+    except Exception as e:
+        results["encode"] = {"skipped": f"model unavailable: {e}"}
+    else:
+        start = time.perf_counter()
+        futures = [service.batcher.submit(t) for t in texts]
+        for f in futures:
+            f.result()
+        results["encode"] = {"texts_per_s": round(len(texts) / (time.perf_counter() - start), 1)}
+    service.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true")
+    print(json.dumps(run(parser.parse_args().quick), indent=2))
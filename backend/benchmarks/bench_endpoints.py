@@ -0,0 +1,123 @@
+"""
+End-to-end endpoint throughput against the fake Groq server.
+
+Runs the real FastAPI app in-process (httpx + ASGI transport, lifespan not run)
+on the configured database, with the LLM answered by benchmarks.fake_groq at the
+given latency / error rate, and reports requests/second, latency percentiles and
+error counts per endpoint. The per-IP rate limiter is disabled for the run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import httpx
+
+from benchmarks.common import percentiles
+from benchmarks.fake_groq import FakeGroqServer
+from benchmarks.pdfgen import make_resume_pdf
+
+JOB_DESCRIPTION = (
+    "We are hiring a senior backend engineer: Python, FastAPI, PostgreSQL, Kubernetes, "
+    "AWS, Go and GraphQL experience. You will own services end to end and mentor others."
+)
+
+
+async def drive(client, name: str, make_request, requests: int, concurrency: int) -> dict:
+    timings, errors = [], 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                r = await make_request(i)
+                errors += r.status_code >= 400
+            except httpx.HTTPError:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {"requests": requests, "errors": errors, "rps": round(requests / elapsed, 1), **percentiles(timings)}
+
+
+async def _run(args) -> dict:
+    import main
+    import routes.resume as resume_routes
+    from models.db import async_engine, init_db
+    from services.ai_service import AIService
+
+    init_db()
+    resume_routes.limiter.enabled = False
+    results = {}
+    with FakeGroqServer(latency_ms=args.llm_latency_ms, error_rate=args.error_rate, seed=0) as groq:
+        # The Groq SDK reads its endpoint from GROQ_BASE_URL
+        os.environ["GROQ_BASE_URL"] = groq.base_url
+        resume_routes.ai_service = AIService()
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            creds = {"email": f"bench-{time.time_ns()}@example.com", "password": "bench-password"}
+            await client.post("/auth/signup", json=creds)
+            login = await client.post("/auth/login", data={"username": creds["email"], "password": creds["password"]})
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            # Distinct PDFs so reviews pay for extraction and parsing; the matches re-upload
+            # the same files and so measure the document-store hit path
+            pdfs = [make_resume_pdf(2, seed=time.time_ns() + i)[0] for i in range(args.requests)]
+
+            def review(i):
+                return client.post("/review-resume", headers=headers,
+                                   files={"file": (f"cv{i}.pdf", pdfs[i], "application/pdf")})
+
+            def match(i):
+                return client.post("/match-resume", headers=headers, data={"job_description": JOB_DESCRIPTION},
+                                   files={"file": (f"cv{i}.pdf", pdfs[i], "application/pdf")})
+
+            def history(i):
+                return client.get("/history", headers=headers)
+
+            def match_history(i):
+                return client.get("/match-history", headers=headers)
+
+            async def revalidate(path):
+                # Repeat polls from a client holding the current ETag: 304 without loading rows
+                etag = (await client.get(path, headers=headers)).headers["etag"]
+                return lambda i: client.get(path, headers={**headers, "If-None-Match": etag})
+
+            results["review_resume"] = await drive(client, "review", review, args.requests, args.concurrency)
+            results["match_resume"] = await drive(client, "match", match, args.requests, args.concurrency)
+            results["history"] = await drive(client, "history", history, args.requests * 5, args.concurrency)
+            results["history_not_modified"] = await drive(
+                client, "history", await revalidate("/history"), args.requests * 5, args.concurrency)
+            results["match_history"] = await drive(
+                client, "match_history", match_history, args.requests * 5, args.concurrency)
+            results["match_history_not_modified"] = await drive(
+                client, "match_history", await revalidate("/match-history"), args.requests * 5, args.concurrency)
+        results["llm"] = {"requests": groq.requests, "simulated_errors": groq.errors,
+                          "latency_ms": args.llm_latency_ms}
+    await async_engine.dispose()
+    return results
+
+
+def run(quick: bool = False, requests: int | None = None, concurrency: int = 10,
+        llm_latency_ms: float = 200, error_rate: float = 0.0) -> dict:
+    args = argparse.Namespace(
+        requests=requests or (20 if quick else 100), concurrency=concurrency,
+        llm_latency_ms=llm_latency_ms, error_rate=error_rate,
+    )
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--requests", type=int)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--llm-latency-ms", type=float, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    a = parser.parse_args()
+    print(json.dumps(run(a.quick, a.requests, a.concurrency, a.llm_latency_ms, a.error_rate), indent=2))
@@ -0,0 +1,31 @@
+"""MatchingService keyword extraction and scoring on large resume / job texts."""
+import argparse
+import json
+
+from benchmarks.common import best_of
+from benchmarks.pdfgen import resume_lines
+from services.matching_service import MatchingService
+
+
+def run(quick: bool = False) -> dict:
+    service = MatchingService()
+    job_kw = service.extract_keywords(" ".join(resume_lines(2, seed=1)))
+    results = {}
+    for chars in (10_000, 100_000) if quick else (10_000, 100_000, 1_000_000):
+        text = "\n".join(resume_lines(chars // 2000 + 1, seed=2))
+        text = (text * (chars // len(text) + 1))[:chars]
+        extract = best_of(lambda: service.extract_keywords(text))
+        resume_kw = service.extract_keywords(text)
+        score = best_of(lambda: service.keyword_score(job_kw, resume_kw))
+        results[f"chars_{chars}"] = {
+            "extract_keywords_ms": round(extract * 1000, 3),
+            "keyword_score_ms": round(score * 1000, 4),
+            "mb_per_s": round(chars / extract / 1e6, 2),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quick", action="store_true")
+    print(json.dumps(run(parser.parse_args().quick), indent=2))
@@ -0,0 +1,37 @@
+"""
+PdfParser.extract_text throughput on generated resumes of increasing page counts,
+plus the prompt compressor's cost and the tokens it saves on the extracted text.
+"""
+import argparse
+import json
+
+from benchmarks.common import best_of
+from benchmarks.pdfgen import make_resume_pdf
+from services.parser import PdfParser
+from services.prompt_compressor import PRIORITIES, RESUME_SECTIONS, PromptCompressor
+
+
+def run(quick: bool = False) -> dict:
+    parser = PdfParser()
+    results = {}
+    for pages in (1, 5, 20) if quick else (1, 5, 20, 100):
+        content, _ = make_resume_pdf(pages)
+        seconds = best_of(lambda: parser.extract_text(content))
+        text = parser.extract_text(content)
+        compress = lambda: PromptCompressor.compress(text, RESUME_SECTIONS, PRIORITIES["match"], 700)
+        compress_seconds = best_of(compress)
+        compressed = compress()
+        results[f"pages_{pages}"] = {
+            "extract_ms": round(seconds * 1000, 2),
+            "pages_per_s": round(pages / seconds, 1),
+            "compress_ms": round(compress_seconds * 1000, 3),
+            "prompt_tokens": compressed.original_tokens,
+            "prompt_tokens_saved": compressed.saved_tokens,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quick", action="store_true")
+    print(json.dumps(run(parser.parse_args().quick), indent=2))
@@ -0,0 +1,119 @@
+"""
+Speed / memory / quality of each installed PDF extraction backend (services.parser.BACKENDS).
+
+The corpus is generated by benchmarks.pdfgen: single-column, two-column, and
+two-column written row by row (the case that garbles stream-order extractors).
+Its reference text is exactly what was drawn, in reading order. `--corpus DIR` uses real files
+instead: every DIR/x.pdf, with DIR/x.txt as the reference when one exists.
+
+Each backend runs in a fresh process so its peak RSS is isolated. Reported per backend:
+- pages_per_s: pages extracted per second over the whole corpus
+- peak_rss_mb: growth of peak RSS while extracting (includes C allocations)
+- similarity_*: difflib ratio of extracted vs reference words (1.0 = identical
+  text in the same reading order), per layout
+- failures: documents that raised or returned no text
+"""
+import argparse
+import difflib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import resource
+import time
+
+from benchmarks.pdfgen import make_resume_pdf
+
+
+def build_corpus(quick: bool) -> list[dict]:
+    docs = []
+    for pages in (1, 3) if quick else (1, 2, 5, 20):
+        for layout, columns, interleaved in (("1col", 1, False), ("2col", 2, False), ("2col_interleaved", 2, True)):
+            for seed in range(3 if quick else 5):
+                content, reference = make_resume_pdf(pages, columns=columns, seed=seed, interleaved=interleaved)
+                docs.append({"layout": layout, "pages": pages, "content": content, "reference": reference})
+    return docs
+
+
+def load_corpus(directory: str) -> list[dict]:
+    from pypdf import PdfReader
+
+    docs = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.pdf"))):
+        with open(path, "rb") as f:
+            content = f.read()
+        ref_path = os.path.splitext(path)[0] + ".txt"
+        reference = open(ref_path, encoding="utf-8").read() if os.path.exists(ref_path) else None
+        try:
+            pages = len(PdfReader(io.BytesIO(content)).pages)
+        except Exception:
+            pages = 1
+        docs.append({"layout": "corpus", "pages": pages, "content": content, "reference": reference})
+    return docs
+
+
+def similarity(extracted: str, reference: str) -> float:
+    return difflib.SequenceMatcher(None, extracted.split(), reference.split(), autojunk=False).ratio()
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def measure_backend(name: str, docs: list[dict]) -> dict:
+    """Runs in a child process."""
+    from services.parser import PdfParser
+
+    parser = PdfParser([name])
+    parser.extract_text(docs[0]["content"])  # import + warm up before the RSS baseline
+    baseline = _peak_rss_mb()
+
+    texts, failures = [], 0
+    start = time.perf_counter()
+    for doc in docs:
+        try:
+            text = parser.extract_text(doc["content"])
+        except Exception:
+            text = ""
+        failures += not text
+        texts.append(text)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "pages_per_s": round(sum(d["pages"] for d in docs) / elapsed, 1),
+        "extract_ms_per_doc": round(elapsed / len(docs) * 1000, 2),
+        "peak_rss_mb": round(_peak_rss_mb() - baseline, 1),
+        "failures": failures,
+    }
+    by_layout = {}
+    for doc, text in zip(docs, texts):
+        if doc["reference"] is not None:
+            by_layout.setdefault(doc["layout"], []).append(similarity(text, doc["reference"]))
+    for layout, scores in sorted(by_layout.items()):
+        result[f"similarity_{layout}"] = round(sum(scores) / len(scores), 3)
+    return result
+
+
+def run(quick: bool = False, corpus: str | None = None, backends: list[str] | None = None) -> dict:
+    from services.parser import available_backends
+
+    docs = load_corpus(corpus) if corpus else build_corpus(quick)
+    if not docs:
+        return {"skipped": f"no PDFs in {corpus}"}
+    results = {}
+    # spawn: each backend starts from a clean interpreter, so peak RSS is its own
+    ctx = multiprocessing.get_context("spawn")
+    for name in backends or available_backends():
+        with ctx.Pool(1) as pool:
+            results[name] = pool.apply(measure_backend, (name, docs))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--corpus", help="directory of PDFs (+ optional .txt references)")
+    parser.add_argument("--backends", help="comma-separated subset (default: all installed)")
+    a = parser.parse_args()
+    print(json.dumps(run(a.quick, a.corpus, a.backends.split(",") if a.backends else None), indent=2))
@@ -0,0 +1,67 @@
+"""
+Bulk re-scoring of JobMatch rows (services.rescoring) after an AI weight change.
+
+Seeds N matches with keyword / AI score components at weight 0.7, then times a
+re-blend to 0.6 (read chunk -> NumPy -> executemany UPDATE) and a second run at the
+same weight, which should find nothing to do. Point DATABASE_URL at Postgres for
+production-like numbers:
+
+    python -m benchmarks.bench_rescore --rows 1000000
+"""
+import argparse
+import json
+import random
+import time
+
+from sqlalchemy import delete, insert
+
+from models.db import JobMatch, SessionLocal, init_db
+from services.rescoring import rescore
+
+
+def seed(db, rows: int, chunk: int = 20_000):
+    rng = random.Random(0)
+    db.execute(delete(JobMatch).filter(JobMatch.filename == "bench-rescore.pdf"))
+    for offset in range(0, rows, chunk):
+        batch = []
+        for _ in range(min(chunk, rows - offset)):
+            kw, ai = round(rng.uniform(0, 100), 1), float(rng.randint(0, 100))
+            batch.append({
+                "user_id": 0, "filename": "bench-rescore.pdf", "keyword_score": kw, "ai_score": ai,
+                "score_weight": 0.7, "match_score": round(kw * 0.3 + ai * 0.7, 1),
+            })
+        db.execute(insert(JobMatch), batch)
+    db.commit()
+
+
+def run(quick: bool = False, rows: int | None = None, chunk_size: int = 10_000) -> dict:
+    init_db()
+    rows = rows or (100_000 if quick else 1_000_000)
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        seed(db, rows)
+        seed_s = time.perf_counter() - start
+        stats = rescore(0.6, chunk_size=chunk_size, db=db)
+        noop = rescore(0.6, chunk_size=chunk_size, db=db)
+        db.execute(delete(JobMatch).filter(JobMatch.filename == "bench-rescore.pdf"))
+        db.commit()
+    finally:
+        db.close()
+    return {
+        "rows": stats.rows,
+        "seed_s": round(seed_s, 2),
+        "rescore_ms": round(stats.seconds * 1000, 1),
+        "rescore_rows_per_s": round(stats.rows_per_s),
+        "noop_rescore_ms": round(noop.seconds * 1000, 1),
+        "changed": stats.changed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--rows", type=int)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    a = parser.parse_args()
+    print(json.dumps(run(a.quick, a.rows, a.chunk_size), indent=2))
@@ -0,0 +1,21 @@
+"""Helpers shared by the benchmark modules."""
+import statistics
+import time
+
+
+def percentiles(samples: list[float]) -> dict:
+    """p50/p95/p99 in milliseconds for a list of durations in seconds."""
+    if not samples:
+        return {}
+    q = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+    return {"p50_ms": round(q[49] * 1000, 2), "p95_ms": round(q[94] * 1000, 2), "p99_ms": round(q[98] * 1000, 2)}
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    """Fastest wall time of `repeat` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
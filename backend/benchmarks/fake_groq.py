@@ -0,0 +1,184 @@
+"""
+Local stand-in for the Groq chat completions API.
+
+Serves POST /openai/v1/chat/completions with canned JSON answers chosen from the
+system prompt (review, parse, match, ...), simulated latency and an optional
+error rate; supports `stream=true` (SSE chunks). Point the app at it with
+GROQ_BASE_URL.
+
+    python -m benchmarks.fake_groq --port 8100 --latency-ms 800 --error-rate 0.02
+    GROQ_BASE_URL=http://127.0.0.1:8100 uvicorn main:app
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# (substring of the system prompt, canned response); first match wins
+RESPONSES = [
+    ("resume reviewer and parser", {
+        "strengths": ["Clear impact metrics", "Modern backend stack", "Leadership experience"],
+        "weaknesses": ["Summary is generic", "Few quantified results in older roles", "No links to projects"],
+        "suggestions": ["Tailor the summary", "Quantify every bullet", "Add a projects section"],
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS"],
+        "education": ["B.Sc. Computer Science"],
+        "experience": ["Senior Software Engineer, Acme Corp", "Software Engineer, Globex"],
+        "summary": "Backend engineer building data-heavy web services.",
+    }),
+    ("resume reviewer", {
+        "strengths": ["Clear impact metrics", "Modern backend stack", "Leadership experience"],
+        "weaknesses": ["Summary is generic", "Few quantified results in older roles", "No links to projects"],
+        "suggestions": ["Tailor the summary", "Quantify every bullet", "Add a projects section"],
+    }),
+    ("Extract structured data", {
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS"],
+        "education": ["B.Sc. Computer Science"],
+        "experience": ["Senior Software Engineer, Acme Corp", "Software Engineer, Globex"],
+        "summary": "Backend engineer building data-heavy web services.",
+    }),
+    ("skills and qualifications a job description requires", {
+        "skills": ["Python", "Go", "Kubernetes", "PostgreSQL", "GraphQL", "Terraform"],
+    }),
+    ("resume-job matcher", {
+        "match_score": 78,
+        "skill_gaps": ["Go", "GraphQL", "Terraform"],
+        "improvement_suggestions": ["Highlight Kubernetes work", "Mention on-call ownership", "Add Go side projects"],
+    }),
+]
+
+
+class FakeGroqServer:
+    """Threaded HTTP server emulating Groq's chat completions endpoint."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0,
+                 jitter_ms: float = 0, error_rate: float = 0.0, error_status: int = 500,
+                 stream_chunk_chars: int = 24, seed: int | None = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.stream_chunk_chars = stream_chunk_chars
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGroqServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-groq", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def answer(self, messages: list[dict]) -> dict:
+        system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system")
+        for needle, response in RESPONSES:
+            if needle in system:
+                return response
+        return {}
+
+    def _next_outcome(self) -> tuple[float, bool]:
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            failed = self.rng.random() < self.error_rate
+            self.errors += failed
+        return delay, failed
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, body: dict):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.endswith("/chat/completions"):
+                    return self._send_json(404, {"error": {"message": "not found"}})
+
+                delay, failed = server._next_outcome()
+                time.sleep(delay)
+                if failed:
+                    return self._send_json(server.error_status, {"error": {"message": "simulated failure", "type": "server_error"}})
+
+                messages = request.get("messages", [])
+                content = json.dumps(server.answer(messages))
+                prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(content) // 4,
+                         "total_tokens": prompt_tokens + len(content) // 4}
+                base = {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "created": int(time.time()),
+                        "model": request.get("model", "fake")}
+                if request.get("stream"):
+                    return self._stream(base, content, usage)
+                self._send_json(200, {
+                    **base,
+                    "object": "chat.completion",
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                    "usage": usage,
+                })
+
+            def _stream(self, base: dict, content: str, usage: dict):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                size = server.stream_chunk_chars
+                for i in range(0, len(content), size):
+                    chunk = {**base, "object": "chat.completion.chunk",
+                             "choices": [{"index": 0, "delta": {"content": content[i:i + size]}, "finish_reason": None}]}
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                final = {**base, "object": "chat.completion.chunk",
+                         "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "x_groq": {"usage": usage}}
+                self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode())
+                self.close_connection = True
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=500)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    args = parser.parse_args()
+    server = FakeGroqServer(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate, args.error_status)
+    print(f"Fake Groq listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,319 @@
+"""
+Load generator replaying production-shaped traffic against the API.
+
+Each virtual user signs up and logs in, uploads a seed resume, then the workers
+issue a weighted mix of /review-resume, /match-resume, /history and
+/search-resumes as random users. Users re-upload resumes from a small personal
+pool, so repeat uploads hit the document store like in production. History reads
+sometimes follow the X-Next-Cursor header to a second page.
+
+Two targets:
+
+- in-process (default): the app runs inside this process on the configured
+  DATABASE_URL (a temp SQLite file unless set), with its lifespan, and the LLM is
+  answered by an in-process benchmarks.fake_groq server.
+- --base-url: a running server, e.g. gunicorn with N workers on local Postgres.
+  Start the fake LLM and point the app at it yourself:
+
+    python -m benchmarks.fake_groq --port 8100 --latency-ms 800
+    GROQ_BASE_URL=http://127.0.0.1:8100 RATE_LIMIT_ENABLED=false \\
+        gunicorn main:app -k uvicorn.workers.UvicornWorker -w 4
+    python -m benchmarks.loadgen --base-url http://127.0.0.1:8000 --users 50 \\
+        --concurrency 64 --duration 120 --mix review=1,match=2,history=6,search=1
+
+By default the workers run closed-loop (each one sends its next request as soon
+as the last one returns). With --rate, arrivals are Poisson at that many req/s
+with at most --concurrency in flight. Latency is then measured from the scheduled
+start, so queueing inside the generator counts against the server.
+
+The report lists throughput, latency percentiles, error rate and status codes per
+endpoint. Use --output to save it as JSON.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict
+
+import httpx
+
+from benchmarks.bench_endpoints import JOB_DESCRIPTION
+from benchmarks.common import percentiles
+from benchmarks.fake_groq import FakeGroqServer
+from benchmarks.pdfgen import make_resume_pdf
+
+DEFAULT_MIX = "review=1,match=2,history=6,search=1"
+SEARCH_QUERIES = [
+    "python backend engineer", "kubernetes aws devops", "data engineer spark",
+    "react frontend developer", "machine learning pytorch", "postgresql performance tuning",
+]
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """'review=1,match=2' -> {'review': 1.0, 'match': 2.0}, validated against OPERATIONS."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("the mix needs at least one operation with a positive weight")
+    return mix
+
+
+class Stats:
+    """Per-endpoint latency samples and status codes."""
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+
+    def record(self, endpoint: str, seconds: float, status: int | str):
+        self.timings[endpoint].append(seconds)
+        self.statuses[endpoint][status] += 1
+
+    def report(self, elapsed: float) -> dict:
+        out = {}
+        for endpoint in sorted(self.timings):
+            samples = self.timings[endpoint]
+            statuses = self.statuses[endpoint]
+            errors = sum(n for s, n in statuses.items() if not isinstance(s, int) or s >= 400)
+            out[endpoint] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+                "errors": errors,
+                "error_rate": round(errors / len(samples), 4),
+                "statuses": {str(s): n for s, n in sorted(statuses.items(), key=str)},
+                **percentiles(samples),
+            }
+        total = sum(len(t) for t in self.timings.values())
+        total_errors = sum(e["errors"] for e in out.values())
+        out["total"] = {
+            "requests": total,
+            "rps": round(total / elapsed, 2) if elapsed else 0,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total, 4) if total else 0,
+            **percentiles([s for t in self.timings.values() for s in t]),
+        }
+        return out
+
+
+class VirtualUser:
+    """An account with its auth header and a personal pool of resume PDFs."""
+
+    def __init__(self, index: int, run_id: int, pool_size: int, pages: int):
+        self.email = f"load-{run_id}-{index}@example.com"
+        self.password = "load-test-password"
+        self.headers = {}
+        seed = run_id * 1000 + index * pool_size
+        self.pdfs = [make_resume_pdf(pages, columns=1 + (i % 2), seed=seed + i)[0] for i in range(pool_size)]
+        self.next_cursor = None
+
+    def pick_pdf(self, rng: random.Random) -> tuple[str, bytes]:
+        i = rng.randrange(len(self.pdfs))
+        return f"resume-{i}.pdf", self.pdfs[i]
+
+
+async def timed_request(client, stats: Stats, endpoint: str, method: str, url: str,
+                        started: float | None = None, **kwargs) -> httpx.Response | None:
+    start = time.perf_counter() if started is None else started
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        stats.record(endpoint, time.perf_counter() - start, type(e).__name__)
+        return None
+    stats.record(endpoint, time.perf_counter() - start, response.status_code)
+    return response
+
+
+async def login(client, stats: Stats, user: VirtualUser):
+    await timed_request(client, stats, "signup", "POST", "/auth/signup",
+                        json={"email": user.email, "password": user.password})
+    r = await timed_request(client, stats, "login", "POST", "/auth/login",
+                            data={"username": user.email, "password": user.password})
+    if r is None or r.status_code != 200:
+        raise RuntimeError(f"login failed for {user.email}: {r.status_code if r is not None else 'no response'}")
+    user.headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+async def op_review(client, stats, user, rng, started=None):
+    name, pdf = user.pick_pdf(rng)
+    await timed_request(client, stats, "review_resume", "POST", "/review-resume", started, headers=user.headers,
+                        files={"file": (name, pdf, "application/pdf")})
+
+
+async def op_match(client, stats, user, rng, started=None):
+    name, pdf = user.pick_pdf(rng)
+    await timed_request(client, stats, "match_resume", "POST", "/match-resume", started, headers=user.headers,
+                        data={"job_description": JOB_DESCRIPTION}, files={"file": (name, pdf, "application/pdf")})
+
+
+async def op_history(client, stats, user, rng, started=None):
+    # Mostly the first page of either list; sometimes the next page of the previous read
+    path = rng.choice(["/history", "/match-history"])
+    params = {"limit": 20, "view": "summary"}
+    if user.next_cursor and rng.random() < 0.2:
+        path, params["cursor"] = user.next_cursor
+    r = await timed_request(client, stats, path.strip("/").replace("-", "_"), "GET", path, started,
+                            headers=user.headers, params=params)
+    cursor = r.headers.get("X-Next-Cursor") if r is not None else None
+    user.next_cursor = (path, cursor) if cursor else None
+
+
+async def op_search(client, stats, user, rng, started=None):
+    await timed_request(client, stats, "search_resumes", "GET", "/search-resumes", started, headers=user.headers,
+                        params={"query": rng.choice(SEARCH_QUERIES), "top_k": 5})
+
+
+OPERATIONS = {"review": op_review, "match": op_match, "history": op_history, "search": op_search}
+
+
+async def closed_loop(client, stats, users, mix, rng, concurrency: int, deadline: float, max_requests: int | None):
+    names, weights = list(mix), list(mix.values())
+    sent = 0
+
+    async def worker():
+        nonlocal sent
+        while time.perf_counter() < deadline and (max_requests is None or sent < max_requests):
+            sent += 1
+            op = OPERATIONS[rng.choices(names, weights)[0]]
+            await op(client, stats, rng.choice(users), rng)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def open_loop(client, stats, users, mix, rng, rate: float, concurrency: int, deadline: float,
+                    max_requests: int | None):
+    names, weights = list(mix), list(mix.values())
+    in_flight = asyncio.Semaphore(concurrency)
+    tasks = set()
+
+    async def fire(op, user, scheduled):
+        async with in_flight:
+            await op(client, stats, user, rng, started=scheduled)
+
+    next_at = time.perf_counter()
+    sent = 0
+    while next_at < deadline and (max_requests is None or sent < max_requests):
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        op = OPERATIONS[rng.choices(names, weights)[0]]
+        task = asyncio.create_task(fire(op, rng.choice(users), next_at))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        sent += 1
+        next_at += rng.expovariate(rate)
+    await asyncio.gather(*tasks)
+
+
+async def drive(client, args) -> dict:
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    run_id = time.time_ns()
+    users = [VirtualUser(i, run_id, args.resumes_per_user, args.pages) for i in range(args.users)]
+
+    setup = Stats()
+    setup_start = time.perf_counter()
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def prepare(user):
+        async with sem:
+            await login(client, setup, user)
+            # One review per user so history and search have something to return
+            await op_review(client, setup, user, rng)
+
+    await asyncio.gather(*(prepare(u) for u in users))
+    setup_elapsed = time.perf_counter() - setup_start
+
+    stats = Stats()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    if args.rate:
+        await open_loop(client, stats, users, mix, rng, args.rate, args.concurrency, deadline, args.requests)
+    else:
+        await closed_loop(client, stats, users, mix, rng, args.concurrency, deadline, args.requests)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "config": {
+            "target": args.base_url or "in-process", "users": args.users, "concurrency": args.concurrency,
+            "rate": args.rate, "duration_s": round(elapsed, 2), "mix": mix,
+        },
+        "setup": setup.report(setup_elapsed),
+        "endpoints": stats.report(elapsed),
+    }
+
+
+@contextlib.asynccontextmanager
+async def in_process_client(args):
+    """The app on an ASGI transport, with its lifespan and an in-process fake LLM."""
+    import main
+    import routes.resume as resume_routes
+    from models.db import init_db
+    from services.ai_service import AIService
+
+    init_db()
+    resume_routes.limiter.enabled = False
+    with FakeGroqServer(latency_ms=args.llm_latency_ms, jitter_ms=args.llm_jitter_ms,
+                        error_rate=args.llm_error_rate, seed=args.seed) as groq:
+        # The Groq SDK reads its endpoint from GROQ_BASE_URL
+        os.environ["GROQ_BASE_URL"] = groq.base_url
+        resume_routes.ai_service = AIService()
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadgen", timeout=args.timeout) as client:
+                yield client
+
+
+async def _run(args) -> dict:
+    if args.base_url:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+            return await drive(client, args)
+    async with in_process_client(args) as client:
+        return await drive(client, args)
+
+
+def print_report(result: dict):
+    cfg = result["config"]
+    print(f"target={cfg['target']} users={cfg['users']} concurrency={cfg['concurrency']} "
+          f"rate={cfg['rate'] or 'closed-loop'} duration={cfg['duration_s']}s")
+    print(f"{'endpoint':<16}{'reqs':>8}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'err %':>8}  statuses")
+    for name, row in result["endpoints"].items():
+        statuses = " ".join(f"{s}:{n}" for s, n in row.get("statuses", {}).items())
+        print(f"{name:<16}{row['requests']:>8}{row['rps']:>9}{row.get('p50_ms', 0):>10}{row.get('p95_ms', 0):>10}"
+              f"{row.get('p99_ms', 0):>10}{row['error_rate'] * 100:>8.2f}  {statuses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="running server to load; default runs the app in-process")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--resumes-per-user", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=2, help="pages per generated resume")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"operation weights (default {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=16, help="workers (closed loop) / max in flight (--rate)")
+    parser.add_argument("--rate", type=float, help="open-loop Poisson arrival rate in req/s")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of measured load")
+    parser.add_argument("--requests", type=int, help="stop after this many requests")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-latency-ms", type=float, default=500, help="in-process fake LLM only")
+    parser.add_argument("--llm-jitter-ms", type=float, default=100, help="in-process fake LLM only")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="in-process fake LLM only")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args()
+    parse_mix(args.mix)
+
+    result = asyncio.run(_run(args))
+    print_report(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Run the benchmark suite, write JSON results and compare them with a baseline.
+
+    python -m benchmarks.run --quick                      # all suites, small sizes
+    python -m benchmarks.run --save-baseline              # record results/baseline.json
+    python -m benchmarks.run --compare --tolerance 0.25   # exit 1 on >25% regressions
+
+Metrics ending in `_ms` are lower-is-better; `rps`, `*_per_s` and `similarity*` are higher-is-better.
+Baselines are machine-specific: record and compare them on the same hardware.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _parser(quick):
+    from benchmarks import bench_parser
+    return bench_parser.run(quick)
+
+
+def _pdf_backends(quick):
+    from benchmarks import bench_pdf_backends
+    return bench_pdf_backends.run(quick)
+
+
+def _matching(quick):
+    from benchmarks import bench_matching
+    return bench_matching.run(quick)
+
+
+def _rescore(quick):
+    from benchmarks import bench_rescore
+    return bench_rescore.run(quick)
+
+
+def _embeddings(quick):
+    from benchmarks import bench_embeddings
+    return bench_embeddings.run(quick)
+
+
+def _endpoints(quick):
+    from benchmarks import bench_endpoints
+    return bench_endpoints.run(quick)
+
+
+def _db(quick):
+    from benchmarks import bench_db
+    return asyncio.run(bench_db.main(argparse.Namespace(
+        requests=200 if quick else 1000, concurrency=50, upstream_ms=20)))
+
+
+def _auth(quick):
+    from benchmarks import bench_auth
+    return asyncio.run(bench_auth.main(argparse.Namespace(
+        logins=50 if quick else 200, concurrency=25, readers=5)))
+
+
+SUITES = {
+    "parser": _parser,
+    "pdf_backends": _pdf_backends,
+    "matching": _matching,
+    "rescore": _rescore,
+    "embeddings": _embeddings,
+    "endpoints": _endpoints,
+    "db": _db,
+    "auth": _auth,
+}
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def direction(metric: str) -> int:
+    """+1 if higher is better, -1 if lower is better, 0 if not compared."""
+    leaf = metric.rsplit(".", 1)[-1]
+    if leaf.endswith("_ms") or leaf.endswith("_ms_per_doc"):
+        return -1
+    if leaf == "rps" or leaf.endswith("_per_s") or leaf.endswith("per_second") or leaf.startswith("similarity"):
+        return 1
+    return 0
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    base = flatten(baseline.get("results", {}))
+    for metric, value in flatten(current["results"]).items():
+        sign = direction(metric)
+        old = base.get(metric)
+        if not sign or not old:
+            continue
+        change = (value - old) / old * sign  # negative = worse
+        if change < -tolerance:
+            regressions.append(f"{metric}: {old} -> {value} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", default=",".join(SUITES), help=f"comma-separated subset of: {', '.join(SUITES)}")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes for a fast smoke run")
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "latest.json"))
+    parser.add_argument("--baseline", default=os.path.join(RESULTS_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.suite.split(","):
+        print(f"== {name}", file=sys.stderr)
+        results[name] = SUITES[name](args.quick)
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "quick": args.quick,
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "results": results,
+    }
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    for path in [args.output] + ([args.baseline] if args.save_baseline else []):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {path}", file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
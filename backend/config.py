@@ -20,16 +20,78 @@ class Settings:
     if not DATABASE_URL:
         raise ValueError("DATABASE_URL environment variable must be set.")
 
+    # Async engine for `async def` handlers; derived from DATABASE_URL when unset
+    # (postgresql -> postgresql+asyncpg, sqlite -> sqlite+aiosqlite)
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+
+    # Connection pool (per engine, per worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 to disable
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    # Write-behind persistence of review/match rows (PostgreSQL only): rows are queued and
+    # inserted in batches; ids are reserved from the sequence in blocks
+    WRITE_BEHIND_ENABLED: bool = os.getenv("WRITE_BEHIND_ENABLED", "false").lower() == "true"
+    WRITE_BEHIND_BATCH_SIZE: int = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "100"))
+    WRITE_BEHIND_FLUSH_MS: float = float(os.getenv("WRITE_BEHIND_FLUSH_MS", "50"))
+    WRITE_BEHIND_ID_BLOCK_SIZE: int = int(os.getenv("WRITE_BEHIND_ID_BLOCK_SIZE", "100"))
+    # Rows queued before add() falls back to inserting synchronously (bounds memory on a slow DB)
+    WRITE_BEHIND_MAX_QUEUE: int = int(os.getenv("WRITE_BEHIND_MAX_QUEUE", "10000"))
+
+    # zlib level for stored resume text (1 = fastest, 9 = smallest)
+    RESUME_TEXT_COMPRESSION_LEVEL: int = int(os.getenv("RESUME_TEXT_COMPRESSION_LEVEL", "6"))
+
     # Groq AI
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
 
+    # Review and parse a new resume in one LLM call (falls back to two calls if the reply doesn't validate)
+    FUSED_REVIEW_ENABLED: bool = os.getenv("FUSED_REVIEW_ENABLED", "true").lower() == "true"
+
+    # Prompt compression: resume / job description text is cleaned of boilerplate and cut to
+    # its most relevant sections within these budgets (estimated tokens) before LLM calls.
+    # With compression disabled the text is only truncated to the budget.
+    PROMPT_COMPRESSION_ENABLED: bool = os.getenv("PROMPT_COMPRESSION_ENABLED", "true").lower() == "true"
+    PROMPT_RESUME_TOKEN_BUDGET: int = int(os.getenv("PROMPT_RESUME_TOKEN_BUDGET", "1500"))
+    PROMPT_MATCH_RESUME_TOKEN_BUDGET: int = int(os.getenv("PROMPT_MATCH_RESUME_TOKEN_BUDGET", "700"))
+    PROMPT_JOB_TOKEN_BUDGET: int = int(os.getenv("PROMPT_JOB_TOKEN_BUDGET", "600"))
+
+    # Hybrid match score = keyword score * (1 - w) + AI score * w. After changing it, re-score
+    # stored matches (python -m services.rescoring) so old and new scores stay comparable
+    MATCH_AI_WEIGHT: float = float(os.getenv("MATCH_AI_WEIGHT", "0.7"))
+
     # App
     APP_NAME: str = "Resume Matcher API"
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
 
+    # Per-IP rate limits on the upload endpoints; disable only for load tests
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+
+    # PDF text extraction backends in order of preference, with fallback to the next one
+    # on error or empty text: pypdf, pymupdf, pdfminer, pdfium (see services/parser.py)
+    PDF_BACKENDS: list[str] = [
+        b.strip().lower() for b in os.getenv("PDF_BACKENDS", "pypdf").split(",") if b.strip()
+    ]
+
     # File upload limits (bytes)
     MAX_UPLOAD_SIZE: int = int(os.getenv("MAX_UPLOAD_SIZE", "5_242_880"))  # 5MB
 
+    # Embeddings micro-batching: concurrent encodes are coalesced for up to
+    # EMBEDDING_BATCH_WAIT_MS into a single model call of at most EMBEDDING_BATCH_SIZE texts
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    EMBEDDING_BATCH_WAIT_MS: float = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+    # Bounded LRU of query embeddings keyed by normalized query text
+    EMBEDDING_QUERY_CACHE_SIZE: int = int(os.getenv("EMBEDDING_QUERY_CACHE_SIZE", "1024"))
+
+    # Bulk ingestion (services/ingestion.py): documents per INSERT / FAISS add, extraction
+    # processes, and parse_resume calls per minute (0 = unlimited). /admin/ingest only reads
+    # server-side paths under INGEST_ROOT; when unset, only uploaded archives are accepted.
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "100"))
+    INGEST_WORKERS: int = int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 2)))
+    INGEST_PARSE_RPM: float = float(os.getenv("INGEST_PARSE_RPM", "30"))
+    INGEST_ROOT: str = os.getenv("INGEST_ROOT", "")
+
     # CORS
     CORS_ORIGINS: list[str] = [
         o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://127.0.0.1:5173").split(",") if o.strip()
@@ -41,3 +103,18 @@ class Settings:
         raise ValueError("SECRET_KEY environment variable must be set.")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+
+    # Users allowed to call /admin endpoints (comma-separated emails)
+    ADMIN_EMAILS: set[str] = {
+        e.strip().lower() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()
+    }
+
+    # Cache of validated tokens -> user identity, so authenticated requests skip the users query
+    AUTH_CACHE_SIZE: int = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+    AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "300"))
+
+    # Password hashing: bcrypt work factor (existing hashes are upgraded on login),
+    # dedicated hashing threads, and how many hash jobs may queue before returning 503
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    BCRYPT_MAX_CONCURRENCY: int = int(os.getenv("BCRYPT_MAX_CONCURRENCY", "2"))
+    BCRYPT_MAX_PENDING: int = int(os.getenv("BCRYPT_MAX_PENDING", "64"))
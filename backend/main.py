@@ -4,13 +4,16 @@ Resume Matcher API - FastAPI application.
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
 
 from config import get_settings
-from models.db import SessionLocal, ResumeReview
-from routes.resume import router as resume_router
+from models.db import SessionLocal, ResumeDocument, async_engine
+from routes.resume import router as resume_router, write_behind
 from services.embeddings_service import get_embeddings_service
+from services import metrics
 
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
@@ -21,25 +24,45 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 emb_service = get_embeddings_service()
+INDEX_CHUNK_SIZE = 500
+
+def index_stored_resumes(service):
+    """Populate the FAISS index from stored resume documents (runs on the loader thread)."""
+    db = SessionLocal()
+    try:
+        stmt = (
+            select(ResumeDocument)
+            .options(undefer(ResumeDocument.text_compressed))
+            .filter(ResumeDocument.text_compressed.isnot(None))
+            .execution_options(yield_per=INDEX_CHUNK_SIZE)
+        )
+        count = 0
+        for chunk in db.scalars(stmt).partitions():
+            # Decompress one chunk at a time so startup memory stays flat
+            service.add_resumes([d.id for d in chunk], [d.raw_text for d in chunk])
+            count += len(chunk)
+        logger.info(f"Loaded {count} resumes into FAISS index.")
+    except Exception as e:
+        logger.error(f"Error loading FAISS: {e}")
+    finally:
+        db.close()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if emb_service:
-        logger.info("Initializing vector embeddings (FAISS)...")
-        db = SessionLocal()
-        try:
-            reviews = db.query(ResumeReview).all()
-            count = 0
-            for r in reviews:
-                if hasattr(r, "raw_text") and r.raw_text:
-                    emb_service.add_resume(r.id, r.raw_text)
-                    count += 1
-            logger.info(f"Loaded {count} resumes into FAISS index.")
-        except Exception as e:
-            logger.error(f"Error loading FAISS: {e}")
-        finally:
-            db.close()
+        # Load the model in the background so /health answers immediately; /ready reports progress
+        logger.info("Initializing vector embeddings (FAISS) in the background...")
+        emb_service.start(on_ready=index_stored_resumes)
+    if write_behind:
+        write_behind.start()
     yield
+    if write_behind:
+        # Durability: drain queued review/match rows before the worker exits
+        await write_behind.close()
+    if emb_service:
+        emb_service.close()
+    await async_engine.dispose()
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
@@ -49,6 +72,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 # Global Exception Handler
@@ -63,15 +87,25 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 from routes.auth import router as auth_router
+from routes.admin import router as admin_router
+from routes.jobs import router as jobs_router
 
 app.include_router(auth_router)
 app.include_router(resume_router)
+app.include_router(jobs_router)
+app.include_router(admin_router)
 
 @app.get("/")
 def home():
     return {"message": "Resume Matcher API is Running", "docs": "/docs"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Per-stage latency histograms, LLM token counts and cache hit rates (Prometheus text format)."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
     import os
@@ -1,4 +1,14 @@
 """Database models."""
-from .db import Base, ResumeReview, JobMatch, get_db, init_db, SessionLocal
+from .db import Base, ResumeDocument, ResumeReview, JobMatch, get_db, get_async_db, init_db, SessionLocal, AsyncSessionLocal
 
-__all__ = ["Base", "ResumeReview", "JobMatch", "get_db", "init_db", "SessionLocal"]
+__all__ = [
+    "Base",
+    "ResumeDocument",
+    "ResumeReview",
+    "JobMatch",
+    "get_db",
+    "get_async_db",
+    "init_db",
+    "SessionLocal",
+    "AsyncSessionLocal",
+]
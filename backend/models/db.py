@@ -1,16 +1,56 @@
 """SQLAlchemy database configuration and models."""
+import zlib
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Float, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Float, Text, ForeignKey, Index, LargeBinary
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import deferred, relationship, sessionmaker
 
 from config import get_settings
 
 settings = get_settings()
-engine = create_engine(settings.DATABASE_URL)
+
+# asyncio driver used for each database backend
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def engine_options(url: str) -> dict:
+    """Connection pool options from Settings (SQLite keeps its default pool)."""
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching asyncio driver."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{backend}'. Set ASYNC_DATABASE_URL.")
+    query = dict(url.query)
+    if driver == "asyncpg" and "sslmode" in query:
+        # asyncpg takes `ssl` rather than libpq's `sslmode`
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername=f"{backend}+{driver}", query=query).render_as_string(hide_password=False)
+
+
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+# expire_on_commit=False: handlers read the row back after commit without another SELECT
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -23,6 +63,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for an async database session (use from `async def` handlers)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Create all tables in the database."""
     Base.metadata.create_all(bind=engine)
@@ -39,18 +85,66 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ResumeDocument(Base):
+    """Extracted text and parsed structure of an uploaded resume, stored once per distinct file."""
+
+    __tablename__ = "resume_documents"
+
+    PREVIEW_LENGTH = 500
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), unique=True, index=True, nullable=False)  # sha256 of the PDF bytes
+    # Full extracted text, zlib-compressed; deferred so list queries never read it
+    text_compressed = deferred(Column(LargeBinary))
+    text_preview = Column(String(PREVIEW_LENGTH))  # Start of the text for list views
+    parsed_resume = Column(JSON)  # { skills, education, experience, summary }
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    @property
+    def raw_text(self) -> str | None:
+        """Full extracted text, decompressed on first access."""
+        if self.text_compressed is None:
+            return None
+        cached = self.__dict__.get("_raw_text")
+        if cached is None or cached[0] is not self.text_compressed:
+            cached = (self.text_compressed, zlib.decompress(self.text_compressed).decode("utf-8"))
+            self.__dict__["_raw_text"] = cached
+        return cached[1]
+
+    @raw_text.setter
+    def raw_text(self, text: str | None):
+        if text is None:
+            self.text_compressed = None
+            self.text_preview = None
+            return
+        self.text_compressed = zlib.compress(text.encode("utf-8"), settings.RESUME_TEXT_COMPRESSION_LEVEL)
+        self.text_preview = " ".join(text[: self.PREVIEW_LENGTH * 2].split())[: self.PREVIEW_LENGTH]
+
+
 class ResumeReview(Base):
     """Stores resume review (strengths, weaknesses, suggestions)."""
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Keyset pagination of /history: WHERE user_id = ? ORDER BY timestamp DESC, id DESC
+        Index("ix_reviews_user_id_timestamp_id", "user_id", "timestamp", "id"),
+        # max(updated_at) per user: the /history and /search-resumes ETag
+        Index("ix_reviews_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, index=True, nullable=True) # Nullable for backward compatibility
     filename = Column(String)
     analysis = Column(JSON)  # { strengths, weaknesses, suggestions }
     timestamp = Column(DateTime, default=datetime.utcnow)
+    # Last change to the row or to what it displays (re-score, parse filled in on its document)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Structured resume data for matching (Phase 2)
+    # Shared extracted/parsed resume; new rows leave the per-row copies below empty
+    document_id = Column(Integer, ForeignKey("resume_documents.id"), index=True, nullable=True)
+    document = relationship(ResumeDocument)
+
+    # Structured resume data for matching (Phase 2) - legacy per-row copies
     parsed_resume = Column(JSON)  # { skills, education, experience }
     raw_text = Column(Text)  # Original extracted text
 
@@ -59,14 +153,49 @@ class JobMatch(Base):
     """Stores resume + job description match results."""
 
     __tablename__ = "job_matches"
+    __table_args__ = (
+        Index("ix_job_matches_user_id_timestamp_id", "user_id", "timestamp", "id"),
+        Index("ix_job_matches_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, index=True, nullable=True) # Nullable for backward compatibility
     review_id = Column(Integer)  # FK to reviews.id (optional, for linked history)
+    document_id = Column(Integer, ForeignKey("resume_documents.id"), index=True, nullable=True)
+    document = relationship(ResumeDocument)
     filename = Column(String)
     job_description = Column(Text)
-    match_score = Column(Float)  # 0-100
+    match_score = Column(Float)  # 0-100, hybrid of the two components below
+    # Components of match_score and the AI weight it was blended with (NULL on rows from
+    # before they were stored); services/rescoring.py re-blends them when the weight changes
+    keyword_score = Column(Float)
+    ai_score = Column(Float)
+    score_weight = Column(Float)
     skill_gaps = Column(JSON)  # List of missing skills
     improvement_suggestions = Column(JSON)  # List of suggestions
-    parsed_resume = Column(JSON)  # Snapshot for display
+    parsed_resume = Column(JSON)  # Legacy snapshot for display; new rows use document
     timestamp = Column(DateTime, default=datetime.utcnow)
+    # Last change to the row or to what it displays (re-score, parse filled in on its document)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class JobProfile(Base):
+    """A saved job description with its JD-side match inputs precomputed once."""
+
+    __tablename__ = "job_profiles"
+    __table_args__ = (
+        Index("ix_job_profiles_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    title = Column(String(200), nullable=False)
+    description = Column(Text, nullable=False)
+    keywords = Column(JSON)  # MatchingService.extract_keywords(description), sorted
+    skills = Column(JSON)  # Required skills pulled out of the description by the LLM
+    prompt_excerpt = Column(Text)  # Compressed description as it goes into the match prompt
+    # float32 vector from the embedding model (None while embeddings are disabled)
+    embedding = deferred(Column(LargeBinary))
+    embedding_model = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
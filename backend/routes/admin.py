@@ -0,0 +1,97 @@
+"""Admin-only API routes (bulk resume ingestion)."""
+import os
+import shutil
+import tempfile
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_settings
+from models.db import get_async_db, User
+from services.auth_service import require_admin
+from services.embeddings_service import get_embeddings_service
+from services.ingestion import get_job, start_job
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+settings = get_settings()
+
+
+def _resolve_path(path: str) -> str:
+    """Server-side sources must live under INGEST_ROOT."""
+    if not settings.INGEST_ROOT:
+        raise HTTPException(400, "Server-side paths are disabled; set INGEST_ROOT or upload a ZIP")
+    root = os.path.realpath(settings.INGEST_ROOT)
+    full = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, full]) != root:
+        raise HTTPException(400, "path must be inside INGEST_ROOT")
+    if not os.path.exists(full):
+        raise HTTPException(404, "path not found")
+    return full
+
+
+def _save_upload(file: UploadFile) -> str:
+    with tempfile.NamedTemporaryFile(prefix="ingest-", suffix=".zip", delete=False) as tmp:
+        shutil.copyfileobj(file.file, tmp, length=1024 * 1024)
+        return tmp.name
+
+
+@router.post("/ingest", status_code=202)
+async def start_ingest(
+    file: UploadFile | None = File(None),
+    path: str | None = Form(None),
+    parse: bool = Form(False),
+    owner_email: str | None = Form(None),
+    db: AsyncSession = Depends(get_async_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Start a bulk ingestion job from an uploaded ZIP (`file`) or a ZIP/directory under
+    INGEST_ROOT (`path`). Runs in the background; poll GET /admin/ingest/{job_id}.
+    Re-posting the same `path` resumes from its checkpoint.
+    """
+    if (file is None) == (path is None):
+        raise HTTPException(400, "Send exactly one of file or path")
+
+    owner_id = None
+    if owner_email:
+        owner_id = await db.scalar(select(User.id).filter(User.email == owner_email))
+        if owner_id is None:
+            raise HTTPException(404, f"No user with email {owner_email}")
+
+    if file is not None:
+        source, checkpoint, cleanup = await run_in_threadpool(_save_upload, file), None, True
+    else:
+        source = _resolve_path(path)
+        checkpoint, cleanup = f"{source.rstrip(os.sep)}.ingest-checkpoint", False
+
+    label = file.filename if file is not None else path
+    try:
+        job = start_job(
+            source, cleanup=cleanup, label=label, parse=parse, owner_id=owner_id,
+            checkpoint_path=checkpoint, embeddings=get_embeddings_service(),
+        )
+    except RuntimeError as e:
+        if cleanup:
+            os.remove(source)
+        raise HTTPException(409, str(e))
+    return job.as_dict()
+
+
+@router.get("/ingest/{job_id}")
+def ingest_status(job_id: str, admin: User = Depends(require_admin)):
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(404, "Ingestion job not found")
+    return job.as_dict()
+
+
+@router.delete("/ingest/{job_id}")
+def cancel_ingest(job_id: str, admin: User = Depends(require_admin)):
+    """Stop the job after its current batch; the checkpoint keeps what was committed."""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(404, "Ingestion job not found")
+    job.cancel.set()
+    return job.as_dict()
@@ -0,0 +1,92 @@
+"""Saved job profile routes (store a job description once, match against it by id)."""
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from models.db import get_async_db, JobProfile, User
+from routes.resume import ai_service, emb_service, limiter
+from schemas.job import JobProfileCreate
+from services.auth_service import get_current_user
+from services.job_profiles import as_dict, get_profile, prepare_profile
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+async def _prepare(profile: JobProfile):
+    try:
+        await run_in_threadpool(prepare_profile, profile, ai_service, emb_service)
+    except Exception as e:
+        raise HTTPException(503, f"AI service error: {str(e)}")
+
+
+@router.post("", status_code=201)
+@limiter.limit("10/minute")
+async def create_job(
+    request: Request,
+    body: JobProfileCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Save a job description. Its keywords, prompt excerpt, required skills and (with
+    embeddings enabled) embedding are computed now, so matches by `job_id` skip that work.
+    """
+    profile = JobProfile(user_id=current_user.id, title=body.title, description=body.description)
+    await _prepare(profile)
+    db.add(profile)
+    await db.commit()
+    return as_dict(profile)
+
+
+@router.get("")
+async def list_jobs(db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    """The user's saved job profiles, newest first (without descriptions)."""
+    result = await db.execute(
+        select(JobProfile)
+        .options(defer(JobProfile.description), defer(JobProfile.keywords), defer(JobProfile.prompt_excerpt))
+        .filter(JobProfile.user_id == current_user.id)
+        .order_by(JobProfile.created_at.desc(), JobProfile.id.desc())
+    )
+    return [as_dict(p, full=False) for p in result.scalars()]
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    profile = await get_profile(db, current_user.id, job_id)
+    if not profile:
+        raise HTTPException(404, "Job profile not found")
+    return as_dict(profile)
+
+
+@router.put("/{job_id}")
+@limiter.limit("10/minute")
+async def update_job(
+    request: Request,
+    job_id: int,
+    body: JobProfileCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Replace the title/description; the precomputed fields are rebuilt."""
+    profile = await get_profile(db, current_user.id, job_id)
+    if not profile:
+        raise HTTPException(404, "Job profile not found")
+    # End the read transaction before the LLM call
+    await db.commit()
+    profile.title, profile.description = body.title, body.description
+    await _prepare(profile)
+    await db.commit()
+    return as_dict(profile)
+
+
+@router.delete("/{job_id}", status_code=204)
+async def delete_job(job_id: int, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    """Delete a profile; past matches keep their copy of the description."""
+    profile = await get_profile(db, current_user.id, job_id)
+    if not profile:
+        raise HTTPException(404, "Job profile not found")
+    await db.delete(profile)
+    await db.commit()
+    return Response(status_code=204)
@@ -1,28 +1,44 @@
 """Resume and job matching API routes."""
+import asyncio
 import io
+import json
+import logging
+from typing import Literal
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException, Request
+from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from sqlalchemy.orm import Session
+from sqlalchemy import JSON, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, undefer
 
-from models.db import get_db, ResumeReview, JobMatch, User
+from models.db import get_db, get_async_db, AsyncSessionLocal, ResumeDocument, ResumeReview, JobMatch, JobProfile, User
 from services.auth_service import get_current_user
 from services.parser import PdfParser
 from services.ai_service import AIService
 from services.matching_service import MatchingService
-from services.embeddings_service import get_embeddings_service
+from services.embeddings_service import get_embeddings_service, EmbeddingsNotReady
+from services.pagination import paginate
+from services.document_store import content_hash, find_document, save_document, set_parsed_resume
+from services.job_profiles import JobSpec, get_profile, refresh_embedding, spec_from_profile, spec_from_text
+from services.write_behind import get_write_behind
+from services.metrics import LLM_FALLBACKS, timed
+from services.responses import FastJSONResponse, Validator, cache_headers, is_not_modified, make_validator, not_modified
 from config import get_settings
 
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+logger = logging.getLogger(__name__)
+limiter = Limiter(key_func=get_remote_address, enabled=get_settings().RATE_LIMIT_ENABLED)
 
 router = APIRouter(tags=["resume"])
 parser = PdfParser()
 ai_service = AIService()
 matching_service = MatchingService()
 emb_service = get_embeddings_service()
+write_behind = get_write_behind()
 
 
 def validate_file(file: UploadFile, max_size: int):
@@ -32,59 +48,267 @@ def validate_file(file: UploadFile, max_size: int):
     # Size will be checked after read
 
 
+async def read_upload(file: UploadFile) -> bytes:
+    """Read and validate an uploaded resume."""
+    settings = get_settings()
+    content = await file.read()
+    if len(content) > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(400, f"File too large. Max size: {settings.MAX_UPLOAD_SIZE // 1_000_000}MB")
+    validate_file(file, settings.MAX_UPLOAD_SIZE)
+    return content
+
+
+async def load_resume_text(db: AsyncSession, content: bytes):
+    """Look the upload up in the document store; only new files go through PdfParser."""
+    digest = content_hash(content)
+    document = await find_document(db, digest)
+    # End the read transaction so no pooled connection (or SQLite lock) is held during the LLM calls
+    await db.commit()
+    text = document.raw_text if document else await run_in_threadpool(parser.extract_text, content)
+    if not text or not text.strip():
+        raise HTTPException(400, "Could not extract text from PDF")
+    return digest, document, text
+
+
+async def store_resume_document(db: AsyncSession, digest: str, document, text: str, parsed: dict):
+    """Persist a newly seen document (or a missing parse). Returns (document, created)."""
+    if document is None:
+        return await save_document(db, digest, text, parsed)
+    if not document.parsed_resume:
+        await set_parsed_resume(db, document, parsed)
+    return document, False
+
+
+async def persist_result(db: AsyncSession, entry) -> int:
+    """Store a review/match row and return its id (queued for a batched insert in write-behind mode)."""
+    if write_behind:
+        return await write_behind.add(entry)
+    db.add(entry)
+    with timed("db_commit"):
+        await db.commit()
+    return entry.id
+
+
+def check_job_fields(job_description: str | None, job_id: int | None):
+    has_text = bool(job_description and job_description.strip())
+    if has_text == (job_id is not None):
+        raise HTTPException(400, "Send exactly one of job_description or job_id")
+
+
+async def resolve_job(db: AsyncSession, user: User, job_description: str | None, job_id: int | None) -> JobSpec:
+    """The job side of a match: a saved job profile (`job_id`) or the posted description."""
+    check_job_fields(job_description, job_id)
+    if job_id is None:
+        return spec_from_text(job_description)
+    profile = await get_profile(db, user.id, job_id)
+    if profile is None:
+        raise HTTPException(404, "Job profile not found")
+    return spec_from_profile(profile)
+
+
+def keyword_match_score(text: str, parsed: dict, job_keywords: set[str]) -> float:
+    """Keyword overlap (0-100) between the job's keywords and the resume text plus parsed skills."""
+    with timed("keyword_score"):
+        resume_kw = matching_service.extract_keywords(text)
+        for s in parsed.get("skills", []) or []:
+            resume_kw.update(s.lower().split())
+        return matching_service.keyword_score(job_keywords, resume_kw)
+
+
+async def index_document(document, text: str, created: bool):
+    """
+    Add a newly stored document to the FAISS index (re-uploads need no new embedding).
+    Skipped while the model is still loading: the startup indexing reads it from the database.
+    """
+    if not (emb_service and created and emb_service.model_loaded):
+        return
+    try:
+        await emb_service.add_resume_async(document.id, text)
+    except Exception:
+        logger.exception("Indexing resume document %s failed", document.id)
+
+
+async def save_review(db: AsyncSession, user: User, filename: str, digest: str, document, text: str,
+                      analysis: dict, parsed: dict) -> dict:
+    document, created = await store_resume_document(db, digest, document, text, parsed)
+    entry = ResumeReview(
+        filename=filename,
+        analysis=analysis,
+        document_id=document.id,
+        user_id=user.id,
+    )
+    await persist_result(db, entry)
+    await index_document(document, text, created)
+    return {
+        "id": entry.id,
+        "filename": filename,
+        "analysis": analysis,
+        "parsed_resume": parsed,
+    }
+
+
+async def save_match(db: AsyncSession, user: User, filename: str, digest: str, document, text: str,
+                     job_description: str, parsed: dict, match_result: dict, kw_score: float) -> dict:
+    ai_weight = get_settings().MATCH_AI_WEIGHT
+    final_score = matching_service.compute_hybrid_score(kw_score, match_result["match_score"], ai_weight)
+    document, created = await store_resume_document(db, digest, document, text, parsed)
+    entry = JobMatch(
+        filename=filename,
+        job_description=job_description[:5000],
+        match_score=round(final_score, 1),
+        keyword_score=round(kw_score, 1),
+        ai_score=match_result["match_score"],
+        score_weight=ai_weight,
+        skill_gaps=match_result["skill_gaps"],
+        improvement_suggestions=match_result["improvement_suggestions"],
+        document_id=document.id,
+        user_id=user.id,
+    )
+    await persist_result(db, entry)
+    await index_document(document, text, created)
+    return {
+        "id": entry.id,
+        "filename": filename,
+        "match_score": entry.match_score,
+        "keyword_score": entry.keyword_score,
+        "ai_score": entry.ai_score,
+        "skill_gaps": entry.skill_gaps,
+        "improvement_suggestions": entry.improvement_suggestions,
+        "parsed_resume": parsed,
+    }
+
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def event_stream(events) -> StreamingResponse:
+    """Wrap an async generator of SSE strings; proxies must not buffer it."""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def cancel_task(task: asyncio.Task | None):
+    if task and not task.done():
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
 @router.get("/health")
 def health():
     return {"status": "ok"}
 
 
+@router.get("/ready")
+def ready():
+    """Readiness probe: 503 until the embedding model is loaded and the index populated."""
+    if not emb_service:
+        return {"status": "ready", "embeddings": "disabled"}
+    if emb_service.is_ready:
+        return {"status": "ready", "embeddings": "ready"}
+    if emb_service.load_error:
+        return JSONResponse(status_code=503, content={"status": "error", "embeddings": emb_service.load_error})
+    return JSONResponse(status_code=503, content={"status": "loading", "embeddings": "loading"})
+
+
 @router.post("/review-resume")
 @limiter.limit("5/minute")
 async def review_resume(
     request: Request,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Upload resume, get AI review (strengths, weaknesses, suggestions)."""
-    settings = get_settings()
-    content = await file.read()
-    if len(content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(400, f"File too large. Max size: {settings.MAX_UPLOAD_SIZE // 1_000_000}MB")
-    validate_file(file, settings.MAX_UPLOAD_SIZE)
-
-    text = parser.extract_text(content)
-    if not text.strip():
-        raise HTTPException(400, "Could not extract text from PDF")
+    content = await read_upload(file)
+    digest, document, text = await load_resume_text(db, content)
 
     try:
-        analysis = ai_service.review_resume(text)
-        parsed = ai_service.parse_resume(text)
+        # The Groq client is blocking; keep it off the event loop
+        if document and document.parsed_resume:
+            parsed = document.parsed_resume
+            analysis = await run_in_threadpool(ai_service.review_resume, text)
+        else:
+            analysis, parsed = await run_in_threadpool(ai_service.review_and_parse, text)
     except Exception as e:
         raise HTTPException(503, f"AI service error: {str(e)}")
 
-    entry = ResumeReview(
-        filename=file.filename,
-        analysis=analysis,
-        parsed_resume=parsed,
-        raw_text=text[:5000],
-        user_id=current_user.id,
-    )
-    db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    return await save_review(db, current_user, file.filename, digest, document, text, analysis, parsed)
 
-    if emb_service:
-        try:
-            emb_service.add_resume(entry.id, entry.raw_text)
-        except Exception:
-            pass
 
-    return {
-        "id": entry.id,
-        "filename": file.filename,
-        "analysis": analysis,
-        "parsed_resume": parsed,
-    }
+@router.post("/review-resume/stream")
+@limiter.limit("5/minute")
+async def review_resume_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Streaming /review-resume (text/event-stream). Events, in order:
+    `extracted` {chars}, `token` {text} while the review (for a new resume,
+    the fused review + parse) is generated, `parsed` {parsed_resume} (right away when
+    the document was parsed before), `analysis` {analysis}, then `done` with the same
+    body /review-resume returns, or `error` {status, detail}.
+    """
+    content = await read_upload(file)
+    filename = file.filename
+
+    async def events():
+        parse_task = None
+        # Own session: the response outlives the request's dependencies
+        async with AsyncSessionLocal() as db:
+            try:
+                digest, document, text = await load_resume_text(db, content)
+                yield sse_event("extracted", {"chars": len(text)})
+
+                parsed = document.parsed_resume if document and document.parsed_resume else None
+                if parsed is not None:
+                    yield sse_event("parsed", {"parsed_resume": parsed})
+                    call, messages = "review_resume", ai_service.review_messages(text)
+                elif ai_service.fused_review:
+                    call, messages = "review_and_parse", ai_service.review_and_parse_messages(text)
+                else:
+                    call, messages = "review_resume", ai_service.review_messages(text)
+                    # Parse alongside the streamed review instead of after it
+                    parse_task = asyncio.ensure_future(run_in_threadpool(ai_service.parse_resume, text))
+
+                out = {}
+                try:
+                    try:
+                        async for delta in ai_service.stream_json(call, messages, out):
+                            yield sse_event("token", {"text": delta})
+                        if call == "review_and_parse":
+                            analysis, parsed = ai_service.split_review_and_parse(out["result"])
+                        else:
+                            analysis = out["result"]
+                    except ValueError:
+                        # Unparseable or invalid fused reply: redo it as two calls
+                        if call != "review_and_parse":
+                            raise
+                        LLM_FALLBACKS.inc(call="review_and_parse")
+                        analysis, parsed = await run_in_threadpool(ai_service.review_and_parse_separately, text)
+                    if parse_task:
+                        parsed = await parse_task
+                except Exception as e:
+                    raise HTTPException(503, f"AI service error: {str(e)}")
+                if call != "review_resume" or parse_task:
+                    yield sse_event("parsed", {"parsed_resume": parsed})
+                yield sse_event("analysis", {"analysis": analysis})
+
+                result = await save_review(db, current_user, filename, digest, document, text, analysis, parsed)
+                yield sse_event("done", result)
+            except HTTPException as e:
+                yield sse_event("error", {"status": e.status_code, "detail": e.detail})
+            finally:
+                await cancel_task(parse_task)
+
+    return event_stream(events())
 
 
 @router.post("/match-resume")
@@ -92,119 +316,299 @@ async def review_resume(
 async def match_resume(
     request: Request,
     file: UploadFile = File(...),
-    job_description: str = Form(...),
-    db: Session = Depends(get_db),
+    job_description: str | None = Form(None),
+    job_id: int | None = Form(None),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Upload resume + job description, get match score, skill gaps, improvement suggestions.
-    Send job_description as form field: job_description=<text>
+    Send the job as form field job_description=<text>, or job_id=<id> of a saved
+    job profile (see /jobs) to reuse its precomputed keywords, excerpt and skills.
     """
-    settings = get_settings()
-    content = await file.read()
-    if len(content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(400, f"File too large. Max size: {settings.MAX_UPLOAD_SIZE // 1_000_000}MB")
-    validate_file(file, settings.MAX_UPLOAD_SIZE)
-
-    if not job_description or not job_description.strip():
-        raise HTTPException(400, "job_description is required")
-
-    text = parser.extract_text(content)
-    if not text.strip():
-        raise HTTPException(400, "Could not extract text from PDF")
+    content = await read_upload(file)
+    job = await resolve_job(db, current_user, job_description, job_id)
+    digest, document, text = await load_resume_text(db, content)
 
     try:
-        parsed = ai_service.parse_resume(text)
-        match_result = ai_service.match_and_analyze(text, parsed, job_description)
+        parsed = document.parsed_resume if document and document.parsed_resume else await run_in_threadpool(ai_service.parse_resume, text)
+        match_result = await run_in_threadpool(
+            ai_service.match_and_analyze, text, parsed, job.description, job.excerpt, job.skills
+        )
     except Exception as e:
         raise HTTPException(503, f"AI service error: {str(e)}")
 
-    job_kw = matching_service.extract_keywords(job_description)
-    resume_kw = matching_service.extract_keywords(text)
-    for s in parsed.get("skills", []) or []:
-        resume_kw.update(s.lower().split())
-    kw_score = matching_service.keyword_score(job_kw, resume_kw)
-    ai_score = match_result["match_score"]
-    final_score = matching_service.compute_hybrid_score(kw_score, ai_score)
+    kw_score = keyword_match_score(text, parsed, job.keywords)
+    return await save_match(db, current_user, file.filename, digest, document, text,
+                            job.description, parsed, match_result, kw_score)
+
+
+@router.post("/match-resume/stream")
+@limiter.limit("5/minute")
+async def match_resume_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    job_description: str | None = Form(None),
+    job_id: int | None = Form(None),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Streaming /match-resume (text/event-stream). Events, in order:
+    `extracted` {chars}, `parsed` {parsed_resume}, `keyword_score` {keyword_score},
+    `token` {text} while the match analysis is generated, `ai_score` {match_score,
+    skill_gaps, improvement_suggestions}, then `done` with the same body /match-resume
+    returns (match_score is the hybrid score), or `error` {status, detail}.
+    Takes job_description or job_id like /match-resume.
+    """
+    content = await read_upload(file)
+    check_job_fields(job_description, job_id)
+    filename = file.filename
+
+    async def events():
+        async with AsyncSessionLocal() as db:
+            try:
+                job = await resolve_job(db, current_user, job_description, job_id)
+                digest, document, text = await load_resume_text(db, content)
+                yield sse_event("extracted", {"chars": len(text)})
+
+                try:
+                    parsed = document.parsed_resume if document and document.parsed_resume else await run_in_threadpool(ai_service.parse_resume, text)
+                except Exception as e:
+                    raise HTTPException(503, f"AI service error: {str(e)}")
+                yield sse_event("parsed", {"parsed_resume": parsed})
+
+                kw_score = keyword_match_score(text, parsed, job.keywords)
+                yield sse_event("keyword_score", {"keyword_score": round(kw_score, 1)})
+
+                out = {}
+                try:
+                    messages = ai_service.match_messages(text, parsed, job.description, job.excerpt, job.skills)
+                    async for delta in ai_service.stream_json("match_and_analyze", messages, out):
+                        yield sse_event("token", {"text": delta})
+                    # A reply without usable fields (e.g. a non-numeric score) must end as an error event too
+                    match_result = ai_service.normalize_match(out["result"])
+                except Exception as e:
+                    raise HTTPException(503, f"AI service error: {str(e)}")
+                yield sse_event("ai_score", match_result)
+
+                result = await save_match(db, current_user, filename, digest, document, text,
+                                          job.description, parsed, match_result, kw_score)
+                yield sse_event("done", result)
+            except HTTPException as e:
+                yield sse_event("error", {"status": e.status_code, "detail": e.detail})
+
+    return event_stream(events())
 
-    entry = JobMatch(
-        filename=file.filename,
-        job_description=job_description[:5000],
-        match_score=round(final_score, 1),
-        skill_gaps=match_result["skill_gaps"],
-        improvement_suggestions=match_result["improvement_suggestions"],
-        parsed_resume=parsed,
-        user_id=current_user.id,
-    )
-    db.add(entry)
-    db.commit()
-    db.refresh(entry)
 
+def _jd_preview(jd: str | None) -> str | None:
+    return jd[:200] + "..." if jd and len(jd) > 200 else jd
+
+
+def latest_row_validator(request: Request, db: Session, model, user_id: int, *parts) -> Validator:
+    """
+    Validator from the user's rows of `model`: latest updated_at (bumped by in-place
+    changes such as re-scoring) plus count and max id; answered from the user_id indexes.
+    """
+    latest, count, max_id = db.query(
+        func.max(model.updated_at), func.count(model.id), func.max(model.id)
+    ).filter(model.user_id == user_id).one()
+    return make_validator(request, latest, user_id, count, max_id, *parts)
+
+
+def cached_json(items, validator: Validator | None, next_cursor: str | None = None) -> FastJSONResponse:
+    headers = cache_headers(validator) if validator else {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return FastJSONResponse(items, headers=headers)
+
+
+@router.get("/history", response_class=FastJSONResponse)
+def get_history(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Past resume reviews for the user, newest first.
+    Paginated by cursor: pass the X-Next-Cursor response header back as `cursor`.
+    `view=summary` skips the analysis JSON (fetch it via /history/{id}).
+    Supports ETag / Last-Modified revalidation (304 when nothing changed).
+    """
+    validator = latest_row_validator(request, db, ResumeReview, current_user.id)
+    if is_not_modified(request, validator):
+        return not_modified(validator)
+    columns = [ResumeReview.id, ResumeReview.filename, ResumeReview.timestamp]
+    if view == "full":
+        columns.append(ResumeReview.analysis)
+    query = db.query(*columns).filter(ResumeReview.user_id == current_user.id)
+    reviews, next_cursor = paginate(query, ResumeReview.timestamp, ResumeReview.id, cursor, limit)
+    items = []
+    for r in reviews:
+        item = {"id": r.id, "filename": r.filename}
+        if view == "full":
+            item["analysis"] = r.analysis
+        item["timestamp"] = r.timestamp.isoformat() if r.timestamp else None
+        items.append(item)
+    return cached_json(items, validator, next_cursor)
+
+
+@router.get("/history/{review_id}")
+def get_review(review_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Get a single past review, including the parsed resume."""
+    r = db.query(ResumeReview).filter(ResumeReview.id == review_id, ResumeReview.user_id == current_user.id).first()
+    if not r:
+        raise HTTPException(404, "Review not found")
     return {
-        "id": entry.id,
-        "filename": file.filename,
-        "match_score": entry.match_score,
-        "skill_gaps": entry.skill_gaps,
-        "improvement_suggestions": entry.improvement_suggestions,
-        "parsed_resume": parsed,
+        "id": r.id,
+        "filename": r.filename,
+        "analysis": r.analysis,
+        "parsed_resume": r.document.parsed_resume if r.document else r.parsed_resume,
+        "timestamp": r.timestamp.isoformat() if r.timestamp else None,
     }
 
 
-@router.get("/history")
-def get_history(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Get all past resume reviews for the user."""
-    reviews = db.query(ResumeReview).filter(ResumeReview.user_id == current_user.id).order_by(ResumeReview.timestamp.desc()).all()
-    return [
-        {
-            "id": r.id,
-            "filename": r.filename,
-            "analysis": r.analysis,
-            "timestamp": r.timestamp.isoformat() if r.timestamp else None,
-        }
-        for r in reviews
+@router.get("/match-history", response_class=FastJSONResponse)
+def get_match_history(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    view: Literal["full", "summary"] = "full",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Past job match results for the user, newest first.
+    Paginated like /history; `view=summary` returns only score, filename and a JD preview.
+    Supports ETag / Last-Modified revalidation like /history.
+    """
+    validator = latest_row_validator(request, db, JobMatch, current_user.id)
+    if is_not_modified(request, validator):
+        return not_modified(validator)
+    columns = [
+        JobMatch.id,
+        JobMatch.filename,
+        JobMatch.match_score,
+        # Only the preview of the JD leaves the database
+        func.substr(JobMatch.job_description, 1, 201).label("job_description"),
+        JobMatch.timestamp,
     ]
+    if view == "full":
+        columns += [
+            JobMatch.skill_gaps,
+            JobMatch.improvement_suggestions,
+            func.coalesce(ResumeDocument.parsed_resume, JobMatch.parsed_resume, type_=JSON).label("parsed_resume"),
+        ]
+    query = db.query(*columns).filter(JobMatch.user_id == current_user.id)
+    if view == "full":
+        query = query.outerjoin(ResumeDocument, JobMatch.document_id == ResumeDocument.id)
+    matches, next_cursor = paginate(query, JobMatch.timestamp, JobMatch.id, cursor, limit)
+    items = []
+    for m in matches:
+        item = {"id": m.id, "filename": m.filename, "match_score": m.match_score}
+        if view == "full":
+            item.update(
+                skill_gaps=m.skill_gaps,
+                improvement_suggestions=m.improvement_suggestions,
+                parsed_resume=m.parsed_resume,
+            )
+        item["job_description"] = _jd_preview(m.job_description)
+        item["timestamp"] = m.timestamp.isoformat() if m.timestamp else None
+        items.append(item)
+    return cached_json(items, validator, next_cursor)
 
 
-@router.get("/match-history")
-def get_match_history(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Get all past job match results for the user."""
-    matches = db.query(JobMatch).filter(JobMatch.user_id == current_user.id).order_by(JobMatch.timestamp.desc()).all()
-    return [
-        {
-            "id": m.id,
-            "filename": m.filename,
-            "match_score": m.match_score,
-            "skill_gaps": m.skill_gaps,
-            "improvement_suggestions": m.improvement_suggestions,
-            "parsed_resume": m.parsed_resume,
-            "job_description": m.job_description[:200] + "..." if m.job_description and len(m.job_description) > 200 else m.job_description,
-            "timestamp": m.timestamp.isoformat() if m.timestamp else None,
-        }
-        for m in matches
-    ]
+@router.get("/match-history/{match_id}")
+def get_match(match_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Get a single past job match, including the full job description."""
+    m = db.query(JobMatch).filter(JobMatch.id == match_id, JobMatch.user_id == current_user.id).first()
+    if not m:
+        raise HTTPException(404, "Match not found")
+    return {
+        "id": m.id,
+        "filename": m.filename,
+        "match_score": m.match_score,
+        "keyword_score": m.keyword_score,
+        "ai_score": m.ai_score,
+        "skill_gaps": m.skill_gaps,
+        "improvement_suggestions": m.improvement_suggestions,
+        "parsed_resume": m.document.parsed_resume if m.document else m.parsed_resume,
+        "job_description": m.job_description,
+        "timestamp": m.timestamp.isoformat() if m.timestamp else None,
+    }
 
-@router.get("/search-resumes")
-def search_resumes(query: str, top_k: int = 5, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Search resumes by semantic similarity using FAISS."""
+@router.get("/search-resumes", response_class=FastJSONResponse)
+def search_resumes(
+    request: Request,
+    query: str | None = None,
+    job_id: int | None = None,
+    top_k: int = 5,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Search resumes by semantic similarity using FAISS.
+    Pass `query` text, or `job_id` to rank resumes against a saved job profile's stored embedding.
+    Revalidates with ETag / Last-Modified: results only change with the user's reviews,
+    the index contents or the job profile.
+    """
     if not emb_service:
         raise HTTPException(status_code=501, detail="Semantic search is disabled. Set ENABLE_EMBEDDINGS=true.")
-    
+    if (query is None) == (job_id is None):
+        raise HTTPException(400, "Send exactly one of query or job_id")
+
+    profile = None
+    if job_id is not None:
+        profile = db.query(JobProfile).options(undefer(JobProfile.embedding)).filter(
+            JobProfile.id == job_id, JobProfile.user_id == current_user.id
+        ).first()
+        if not profile:
+            raise HTTPException(404, "Job profile not found")
+
+    validator = None
+    if emb_service.is_ready:
+        # Other users' uploads can shift which of this user's resumes make the over-fetched top k
+        profile_version = (profile.updated_at, profile.embedding_model) if profile else None
+        validator = latest_row_validator(
+            request, db, ResumeReview, current_user.id, len(emb_service.id_map), profile_version
+        )
+        if profile is not None and profile.updated_at:
+            latest = validator.last_modified
+            validator.last_modified = max(latest, profile.updated_at) if latest else profile.updated_at
+        if is_not_modified(request, validator):
+            return not_modified(validator)
+
     try:
-        results = emb_service.search(query, top_k=top_k * 3) # over-fetch to account for post-filtering
+        if profile is not None:
+            if not emb_service.is_ready:
+                raise EmbeddingsNotReady(emb_service.load_error or "Embedding model is still loading")
+            # Profiles saved while embeddings were off (or under another model) get one now
+            if refresh_embedding(profile, emb_service):
+                db.commit()
+            results = emb_service.search_by_vector(profile.embedding, top_k=top_k * 3)
+        else:
+            results = emb_service.search(query, top_k=top_k * 3) # over-fetch to account for post-filtering
+    except EmbeddingsNotReady:
+        raise HTTPException(status_code=503, detail="Semantic search index is still loading. Try again shortly.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching vector DB: {str(e)}")
         
     if not results:
-        return []
+        return cached_json([], validator)
         
-    resume_ids = [r["id"] for r in results]
-    reviews = db.query(ResumeReview).filter(
-        ResumeReview.id.in_(resume_ids),
+    # The index is keyed by document; show the user's latest review of each matching document
+    document_ids = [r["id"] for r in results]
+    reviews = db.query(ResumeReview).options(joinedload(ResumeReview.document)).filter(
+        ResumeReview.document_id.in_(document_ids),
         ResumeReview.user_id == current_user.id
-    ).all()
-    
-    review_map = {r.id: r for r in reviews}
-    
+    ).order_by(ResumeReview.timestamp.desc()).all()
+
+    review_map = {}
+    for rev in reviews:
+        review_map.setdefault(rev.document_id, rev)
+
     response = []
     for r in results:
         rev = review_map.get(r["id"])
@@ -213,8 +617,9 @@ def search_resumes(query: str, top_k: int = 5, db: Session = Depends(get_db), cu
                 "id": rev.id,
                 "filename": rev.filename,
                 "score": round(r["score"], 4),
-                "parsed_resume": rev.parsed_resume,
+                "parsed_resume": rev.document.parsed_resume if rev.document else rev.parsed_resume,
+                "preview": rev.document.text_preview if rev.document else None,
                 "timestamp": rev.timestamp.isoformat() if rev.timestamp else None,
             })
             
-    return response
+    return cached_json(response, validator)
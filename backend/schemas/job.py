@@ -0,0 +1,11 @@
+"""Job profile schemas."""
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobProfileCreate(BaseModel):
+    """A job description to save for repeated matching."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    title: str = Field(min_length=1, max_length=200)
+    description: str = Field(min_length=1)
@@ -1,9 +1,23 @@
 """AI-powered services using Groq LLM."""
 import json
+import re
+import time
+from collections.abc import AsyncIterator
 
-from groq import Groq
+from groq import AsyncGroq, BadRequestError, Groq
+from pydantic import ValidationError
 
 from config import get_settings
+from schemas.resume import ResumeAnalysis, StructuredResume
+from services.metrics import LLM_ERRORS, LLM_FALLBACKS, STAGE_SECONDS, record_llm_usage, timed
+from services.prompt_compressor import PromptCompressor
+
+MODEL = "llama-3.3-70b-versatile"
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class FusedResponseError(ValueError):
+    """The fused review+parse reply is missing fields or doesn't match the schemas."""
 
 
 class AIService:
@@ -12,55 +26,167 @@ class AIService:
     def __init__(self):
         settings = get_settings()
         self.client = Groq(api_key=settings.GROQ_API_KEY)
+        # Used by the streaming endpoints so tokens are relayed without a thread per request
+        self.async_client = AsyncGroq(api_key=settings.GROQ_API_KEY)
+        self.compressor = PromptCompressor(
+            resume_budget=settings.PROMPT_RESUME_TOKEN_BUDGET,
+            job_budget=settings.PROMPT_JOB_TOKEN_BUDGET,
+            enabled=settings.PROMPT_COMPRESSION_ENABLED,
+        )
+        self.match_resume_budget = settings.PROMPT_MATCH_RESUME_TOKEN_BUDGET
+        self.fused_review = settings.FUSED_REVIEW_ENABLED
+
+    def _chat_json(self, call: str, messages: list[dict]) -> dict:
+        """Run a JSON-mode completion, recording latency and token usage under `call`."""
+        try:
+            with timed(f"llm_{call}"):
+                chat = self.client.chat.completions.create(
+                    messages=messages,
+                    model=MODEL,
+                    response_format={"type": "json_object"},
+                )
+        except Exception:
+            LLM_ERRORS.inc(call=call)
+            raise
+        record_llm_usage(call, getattr(chat, "usage", None))
+        return json.loads(chat.choices[0].message.content)
+
+    async def stream_json(self, call: str, messages: list[dict], out: dict) -> AsyncIterator[str]:
+        """
+        Stream a completion's text as it arrives; once exhausted, `out["result"]` holds the parsed JSON.
+
+        Groq's JSON mode cannot be combined with streaming, so this relies on the prompt asking
+        for JSON and takes the outermost {...} of the reply.
+        """
+        parts = []
+        start = time.perf_counter()
+        first = True
+        try:
+            with timed(f"llm_{call}"):
+                stream = await self.async_client.chat.completions.create(messages=messages, model=MODEL, stream=True)
+                async for chunk in stream:
+                    x_groq = getattr(chunk, "x_groq", None)
+                    if x_groq is not None and getattr(x_groq, "usage", None) is not None:
+                        record_llm_usage(call, x_groq.usage)
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        if first:
+                            STAGE_SECONDS.observe(time.perf_counter() - start, stage=f"llm_{call}_first_token")
+                            first = False
+                        parts.append(delta)
+                        yield delta
+            text = "".join(parts)
+            match = _JSON_OBJECT.search(text)
+            out["result"] = json.loads(match.group(0) if match else text)
+        except Exception:
+            LLM_ERRORS.inc(call=call)
+            raise
+
+    def review_messages(self, resume_text: str) -> list[dict]:
+        resume_text = self.compressor.compress_resume(resume_text, "review_resume", "review")
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional resume reviewer. Output your analysis *strictly* in valid JSON format, "
+                    "with absolutely no markdown formatting, backticks, or other text. "
+                    "The JSON strictly MUST have this exact structure:\n"
+                    "{\n"
+                    '  "strengths": ["...", "...", "..."],\n'
+                    '  "weaknesses": ["...", "...", "..."],\n'
+                    '  "suggestions": ["...", "...", "..."]\n'
+                    "}"
+                )
+            },
+            {"role": "user", "content": f"Review this resume and provide the JSON output:\n{resume_text}"},
+        ]
 
     def review_resume(self, resume_text: str) -> dict:
         """Get strengths, weaknesses, suggestions for a resume."""
-        chat = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a professional resume reviewer. Output your analysis *strictly* in valid JSON format, "
-                        "with absolutely no markdown formatting, backticks, or other text. "
-                        "The JSON strictly MUST have this exact structure:\n"
-                        "{\n"
-                        '  "strengths": ["...", "...", "..."],\n'
-                        '  "weaknesses": ["...", "...", "..."],\n'
-                        '  "suggestions": ["...", "...", "..."]\n'
-                        "}"
-                    )
-                },
-                {"role": "user", "content": f"Review this resume and provide the JSON output:\n{resume_text}"},
-            ],
-            model="llama-3.3-70b-versatile",
-            response_format={"type": "json_object"},
-        )
-        return json.loads(chat.choices[0].message.content)
+        return self._chat_json("review_resume", self.review_messages(resume_text))
+
+    def review_and_parse_messages(self, resume_text: str) -> list[dict]:
+        resume_text = self.compressor.compress_resume(resume_text, "review_and_parse", "review")
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional resume reviewer and parser. Review the resume and extract its "
+                    "structured data in one answer. Output *strictly* in valid JSON format, with no markdown "
+                    "or other text. The JSON must have this exact structure:\n"
+                    "{\n"
+                    '  "strengths": ["...", "...", "..."],\n'
+                    '  "weaknesses": ["...", "...", "..."],\n'
+                    '  "suggestions": ["...", "...", "..."],\n'
+                    '  "skills": ["...", "..."],\n'
+                    '  "education": ["...", "..."],\n'
+                    '  "experience": ["...", "..."],\n'
+                    '  "summary": "..."\n'
+                    "}"
+                )
+            },
+            {"role": "user", "content": f"Review and parse this resume into the JSON output:\n{resume_text}"},
+        ]
+
+    @staticmethod
+    def split_review_and_parse(data: dict) -> tuple[dict, dict]:
+        """Validate a fused reply against ResumeAnalysis / StructuredResume; raises FusedResponseError."""
+        if not isinstance(data, dict):
+            raise FusedResponseError("reply is not a JSON object")
+        missing = [k for k in (*ResumeAnalysis.model_fields, *StructuredResume.model_fields) if k not in data]
+        if missing:
+            raise FusedResponseError(f"missing fields: {', '.join(missing)}")
+        try:
+            analysis = ResumeAnalysis.model_validate(data)
+            parsed = StructuredResume.model_validate(data)
+        except ValidationError as e:
+            raise FusedResponseError(str(e)) from e
+        return analysis.model_dump(), parsed.model_dump()
+
+    def review_and_parse(self, resume_text: str) -> tuple[dict, dict]:
+        """
+        Review and structured parse in one completion; returns (analysis, parsed_resume).
+        Falls back to separate review_resume + parse_resume calls if the fused reply doesn't validate.
+        """
+        if self.fused_review:
+            try:
+                return self.split_review_and_parse(
+                    self._chat_json("review_and_parse", self.review_and_parse_messages(resume_text))
+                )
+            except (FusedResponseError, json.JSONDecodeError, BadRequestError):
+                # BadRequestError: Groq rejects JSON-mode output that isn't valid JSON
+                LLM_FALLBACKS.inc(call="review_and_parse")
+        return self.review_and_parse_separately(resume_text)
+
+    def review_and_parse_separately(self, resume_text: str) -> tuple[dict, dict]:
+        return self.review_resume(resume_text), self.parse_resume(resume_text)
+
+    def parse_messages(self, resume_text: str) -> list[dict]:
+        resume_text = self.compressor.compress_resume(resume_text, "parse_resume", "parse")
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "Extract structured data from the resume. Output *strictly* in valid JSON format. "
+                    "Do not include markdown or explanations. Use keys: 'skills', 'education', 'experience', 'summary'. "
+                    "The JSON must have this exact structure:\n"
+                    "{\n"
+                    '  "skills": ["...", "..."],\n'
+                    '  "education": ["...", "..."],\n'
+                    '  "experience": ["...", "..."],\n'
+                    '  "summary": "..."\n'
+                    "}"
+                )
+            },
+            {"role": "user", "content": f"Parse this resume into JSON:\n{resume_text}"},
+        ]
 
     def parse_resume(self, resume_text: str) -> dict:
         """Extract structured data (skills, education, experience) from resume."""
-        chat = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Extract structured data from the resume. Output *strictly* in valid JSON format. "
-                        "Do not include markdown or explanations. Use keys: 'skills', 'education', 'experience', 'summary'. "
-                        "The JSON must have this exact structure:\n"
-                        "{\n"
-                        '  "skills": ["...", "..."],\n'
-                        '  "education": ["...", "..."],\n'
-                        '  "experience": ["...", "..."],\n'
-                        '  "summary": "..."\n'
-                        "}"
-                    )
-                },
-                {"role": "user", "content": f"Parse this resume into JSON:\n{resume_text}"},
-            ],
-            model="llama-3.3-70b-versatile",
-            response_format={"type": "json_object"},
-        )
-        data = json.loads(chat.choices[0].message.content)
+        return self.normalize_parsed(self._chat_json("parse_resume", self.parse_messages(resume_text)))
+
+    @staticmethod
+    def normalize_parsed(data: dict) -> dict:
         return {
             "skills": data.get("skills", []) or [],
             "education": data.get("education", []) or [],
@@ -68,50 +194,86 @@ class AIService:
             "summary": data.get("summary", "") or "",
         }
 
-    def match_and_analyze(
-        self, resume_text: str, parsed_resume: dict, job_description: str
-    ) -> dict:
-        """
-        Compare resume to job description. Returns:
-        - match_score (0-100)
-        - skill_gaps (missing skills)
-        - improvement_suggestions
-        """
+    def job_skills_messages(self, job_description: str) -> list[dict]:
+        job_excerpt = self.compressor.compress_job(job_description, "extract_job_skills")
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "Extract the skills and qualifications a job description requires. Output *strictly* in valid JSON format. "
+                    "Do not include markdown. Use short skill names (e.g. \"Python\", \"Kubernetes\"), most important first. "
+                    "The JSON must have this exact structure:\n"
+                    '{\n  "skills": ["...", "..."]\n}'
+                )
+            },
+            {"role": "user", "content": f"Job Description:\n{job_excerpt}"},
+        ]
+
+    def extract_job_skills(self, job_description: str) -> list[str]:
+        """Required skills of a job description (computed once per saved job profile)."""
+        result = self._chat_json("extract_job_skills", self.job_skills_messages(job_description))
+        skills = result.get("skills", []) or []
+        return [str(s).strip() for s in skills if str(s).strip()]
+
+    def match_messages(
+        self, resume_text: str, parsed_resume: dict, job_description: str,
+        job_excerpt: str | None = None, job_skills: list[str] | None = None,
+    ) -> list[dict]:
+        """`job_excerpt` / `job_skills`: precomputed JD inputs from a saved job profile."""
         skills_str = ", ".join(parsed_resume.get("skills", []) or [])
+        # Section-aware excerpts (skills and experience first) instead of the leading 2000 characters
+        resume_excerpt = self.compressor.compress_resume(
+            resume_text, "match_and_analyze", "match", budget=self.match_resume_budget
+        )
+        if job_excerpt is None:
+            job_excerpt = self.compressor.compress_job(job_description, "match_and_analyze")
+        required = f"\nRequired skills from the job: {', '.join(job_skills)}\n" if job_skills else ""
         prompt = f"""
 Resume text (excerpt):
-{resume_text[:2000]}
+{resume_excerpt}
 
 Extracted skills from resume: {skills_str}
 
 Job Description:
-{job_description[:2000]}
-
+{job_excerpt}
+{required}
 Analyze the resume against the job description. Output strictly in JSON with:
 - "match_score": number 0-100 (how well does the resume match the job)
 - "skill_gaps": list of 3-5 key skills/qualifications the job requires but the resume lacks
 - "improvement_suggestions": list of 3-5 actionable suggestions to improve the resume for this job
 """
-        chat = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert resume-job matcher. Output *strictly* in valid JSON format. "
-                        "Do not include markdown. The JSON must have this exact structure:\n"
-                        "{\n"
-                        '  "match_score": 85,\n'
-                        '  "skill_gaps": ["...", "..."],\n'
-                        '  "improvement_suggestions": ["...", "..."]\n'
-                        "}"
-                    )
-                },
-                {"role": "user", "content": prompt},
-            ],
-            model="llama-3.3-70b-versatile",
-            response_format={"type": "json_object"},
-        )
-        result = json.loads(chat.choices[0].message.content)
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are an expert resume-job matcher. Output *strictly* in valid JSON format. "
+                    "Do not include markdown. The JSON must have this exact structure:\n"
+                    "{\n"
+                    '  "match_score": 85,\n'
+                    '  "skill_gaps": ["...", "..."],\n'
+                    '  "improvement_suggestions": ["...", "..."]\n'
+                    "}"
+                )
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    def match_and_analyze(
+        self, resume_text: str, parsed_resume: dict, job_description: str,
+        job_excerpt: str | None = None, job_skills: list[str] | None = None,
+    ) -> dict:
+        """
+        Compare resume to job description. Returns:
+        - match_score (0-100)
+        - skill_gaps (missing skills)
+        - improvement_suggestions
+        """
+        messages = self.match_messages(resume_text, parsed_resume, job_description, job_excerpt, job_skills)
+        result = self._chat_json("match_and_analyze", messages)
+        return self.normalize_match(result)
+
+    @staticmethod
+    def normalize_match(result: dict) -> dict:
         return {
             "match_score": float(result.get("match_score", 0)),
             "skill_gaps": result.get("skill_gaps", []) or [],
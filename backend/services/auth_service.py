@@ -1,4 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import asyncio
+import threading
+import time
+
 import bcrypt
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
@@ -7,11 +12,29 @@ from sqlalchemy.orm import Session
 
 from config import get_settings
 from models.db import get_db, User
+from services.cache import TTLCache
+from services.metrics import register_cache
 
 settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Validated access token -> (user id, email). Per process; entries never outlive the token's exp.
+# Nothing changes a user's id or email after signup; code that starts to (account deletion,
+# email change) must drop that user's entries here, or tokens keep resolving until the TTL.
+_token_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+register_cache("auth_token", _token_cache)
+
+
+def clear_token_cache():
+    _token_cache.clear()
+
+# bcrypt runs on its own bounded pool so login storms can't occupy the shared request threadpool
+_hash_executor = ThreadPoolExecutor(max_workers=settings.BCRYPT_MAX_CONCURRENCY, thread_name_prefix="bcrypt")
+_hash_lock = threading.Lock()
+_hash_pending = 0
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
@@ -20,10 +43,40 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(pwd_bytes, salt)
     return hashed_password.decode('utf-8')
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if the hash was made with a different work factor than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return True
+
+async def _run_hashing(fn, *args):
+    """Run a bcrypt call on the hashing pool; 503 when too many are already queued."""
+    global _hash_pending
+    with _hash_lock:
+        if _hash_pending >= settings.BCRYPT_MAX_PENDING:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        with _hash_lock:
+            _hash_pending -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hashing(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     if expires_delta:
@@ -35,6 +88,14 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     return encoded_jwt
 
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    """
+    Resolve the bearer token to a (detached) User carrying id and email.
+    Cached per token, so repeat requests skip both JWT decoding and the users query.
+    """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return User(id=cached[0], email=cached[1])
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -47,8 +108,23 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
-    user = db.query(User).filter(User.email == email).first()
+
+    user_id = payload.get("uid")
+    if user_id is not None:
+        # Primary-key lookup; tokens issued before the uid claim fall back to email
+        user = db.query(User.id, User.email).filter(User.id == user_id, User.email == email).first()
+    else:
+        user = db.query(User.id, User.email).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
-    return user
+
+    ttl = min(settings.AUTH_CACHE_TTL_SECONDS, payload.get("exp", 0) - time.time())
+    if ttl > 0:
+        _token_cache.set(token, (user.id, user.email), ttl=ttl)
+    return User(id=user.id, email=user.email)
+
+def require_admin(current_user: User = Depends(get_current_user)):
+    """Allow only users whose email is listed in ADMIN_EMAILS."""
+    if current_user.email.lower() not in settings.ADMIN_EMAILS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
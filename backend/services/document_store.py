@@ -0,0 +1,65 @@
+"""
+Content-addressed resume store.
+
+Each distinct uploaded PDF (by sha256 of its bytes) is extracted and parsed once
+into a ResumeDocument row; reviews and matches reference it by document_id, so
+re-uploads skip PDF extraction, the parse_resume LLM call and re-embedding.
+"""
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from models.db import JobMatch, ResumeDocument, ResumeReview
+from services.metrics import HitStats, register_cache, timed
+
+# Uploads that matched an already stored document
+lookup_stats = HitStats()
+register_cache("resume_document", lookup_stats)
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+async def find_document(db: AsyncSession, digest: str) -> ResumeDocument | None:
+    result = await db.execute(
+        select(ResumeDocument)
+        .options(undefer(ResumeDocument.text_compressed))
+        .filter(ResumeDocument.content_hash == digest)
+    )
+    document = result.scalars().first()
+    lookup_stats.record(document is not None)
+    return document
+
+
+async def save_document(db: AsyncSession, digest: str, raw_text: str, parsed_resume: dict) -> tuple[ResumeDocument, bool]:
+    """
+    Store a newly extracted document. Returns (document, created); if a concurrent
+    upload of the same file won the insert, its row is returned with created=False.
+    """
+    document = ResumeDocument(content_hash=digest, raw_text=raw_text, parsed_resume=parsed_resume)
+    db.add(document)
+    try:
+        with timed("db_commit"):
+            await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        existing = await find_document(db, digest)
+        if existing is None:
+            raise
+        return existing, False
+    return document, True
+
+
+async def set_parsed_resume(db: AsyncSession, document: ResumeDocument, parsed_resume: dict):
+    """Fill in the parse for a document stored without one."""
+    document.parsed_resume = parsed_resume
+    # History rows of every user that show this document now render differently
+    now = datetime.utcnow()
+    for model in (ResumeReview, JobMatch):
+        await db.execute(update(model).filter(model.document_id == document.id).values(updated_at=now))
+    await db.commit()
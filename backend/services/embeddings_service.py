@@ -7,11 +7,116 @@ Usage (when enabled):
     emb = EmbeddingsService()
     emb.add_resume(id=1, text="...")
     scores = emb.search("python developer job description")
+
+All model inference goes through an EmbeddingBatcher: concurrent add/search calls
+are collected for a few milliseconds and encoded together in one batched
+``model.encode`` call on a worker thread.
+
+The model is not loaded in the constructor. Call ``start()`` to load it (and
+optionally populate the index) on a background thread; ``is_ready`` turns true
+once that has finished, so the app can serve requests while it loads.
 """
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+
+from config import get_settings
+from services.cache import LRUCache
+from services.metrics import register_cache, timed
 
 EMBEDDINGS_ENABLED = os.getenv("ENABLE_EMBEDDINGS", "false").lower() == "true"
 
+
+class EmbeddingsNotReady(RuntimeError):
+    """Raised when the index is queried before the model has finished loading."""
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a search query: lowercase with collapsed whitespace."""
+    return " ".join(query.lower().split())
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent encode requests into batched model calls.
+
+    A single worker thread takes the first queued text, waits up to
+    ``max_wait_ms`` for more to arrive (or until ``max_batch_size`` is reached),
+    runs ``encode_fn`` once for the whole batch and resolves each caller's future.
+    """
+
+    def __init__(self, encode_fn, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self._encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Queue = Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue a text for encoding; the future resolves to its vector."""
+        if self._closed:
+            raise RuntimeError("EmbeddingBatcher is closed")
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str):
+        """Encode a single text, blocking until its batch has run."""
+        return self.submit(text).result()
+
+    async def encode_async(self, text: str):
+        """Encode a single text without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def close(self):
+        """Stop the worker after the already queued requests are processed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch):
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            with timed("embedding_encode"):
+                vectors = self._encode_fn([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+
 if EMBEDDINGS_ENABLED:
     try:
         from sentence_transformers import SentenceTransformer
@@ -22,24 +127,163 @@ if EMBEDDINGS_ENABLED:
             """FAISS-based semantic search for resume-job matching."""
 
             def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-                self.model = SentenceTransformer(model_name)
-                self.dimension = self.model.get_sentence_embedding_dimension()
-                self.index = faiss.IndexFlatIP(self.dimension)  # Inner product (cosine with normalized)
-                self.id_map = []  # Maps index position to resume id
+                settings = get_settings()
+                self.model_name = model_name
+                self.model = None
+                self.dimension = None
+                self.index = None
+                self.id_map = []  # Maps index position to resume document id
+                self._indexed_ids = set()
+                self._lock = threading.Lock()  # Guards index + id_map across request threads
+                self._loaded = threading.Event()  # Model load attempt finished
+                self._ready = threading.Event()  # Model loaded and stored resumes indexed
+                self._finished = threading.Event()  # Loader thread done, whether or not it succeeded
+                self._loader = None
+                self.load_error = None
+                self.query_cache = LRUCache(settings.EMBEDDING_QUERY_CACHE_SIZE)
+                register_cache("query_embedding", self.query_cache)
+                self.batcher = EmbeddingBatcher(
+                    self._encode_batch,
+                    max_batch_size=settings.EMBEDDING_BATCH_SIZE,
+                    max_wait_ms=settings.EMBEDDING_BATCH_WAIT_MS,
+                )
+
+            @property
+            def is_ready(self) -> bool:
+                return self._ready.is_set()
+
+            @property
+            def model_loaded(self) -> bool:
+                """The model is usable; the stored resumes may still be being indexed."""
+                return self.model is not None
+
+            def start(self, on_ready=None):
+                """Load the model on a background thread, then run ``on_ready(self)``.
+
+                ``on_ready`` is meant for populating the index from the database;
+                the service only reports ready once it has returned.
+                """
+                if self._loader is None:
+                    self._loader = threading.Thread(
+                        target=self._load, args=(on_ready,), name="embedding-loader", daemon=True
+                    )
+                    self._loader.start()
+                return self._loader
+
+            def wait_until_ready(self, timeout: float | None = None) -> bool:
+                """Wait for the loader; False if it timed out or the model failed to load."""
+                self._finished.wait(timeout)
+                return self.is_ready
+
+            def _load(self, on_ready=None):
+                try:
+                    model = SentenceTransformer(self.model_name)
+                    self.dimension = model.get_sentence_embedding_dimension()
+                    self.index = faiss.IndexFlatIP(self.dimension)  # Inner product (cosine with normalized)
+                    self.model = model
+                except Exception as e:
+                    self.load_error = str(e)
+                finally:
+                    self._loaded.set()
+                try:
+                    if self.model is None:
+                        return
+                    if on_ready:
+                        try:
+                            on_ready(self)
+                        except Exception as e:
+                            self.load_error = str(e)
+                    self._ready.set()
+                finally:
+                    self._finished.set()
+
+            def _encode_batch(self, texts: list[str]):
+                self.start()
+                self._loaded.wait()
+                if self.model is None:
+                    raise RuntimeError(f"Embedding model failed to load: {self.load_error}")
+                emb = self.model.encode(texts, batch_size=len(texts), normalize_embeddings=True)
+                return emb.astype("float32")
+
+            def _add_vectors(self, ids: list[int], vectors):
+                vectors = np.asarray(vectors, dtype="float32").reshape(len(ids), self.dimension)
+                with self._lock:
+                    # Resumes stored while the index was being populated may arrive twice
+                    keep = [i for i, id in enumerate(ids) if id not in self._indexed_ids]
+                    if not keep:
+                        return
+                    self.index.add(vectors[keep])
+                    for i in keep:
+                        self.id_map.append(ids[i])
+                        self._indexed_ids.add(ids[i])
+
+            def _search_vector(self, q_emb, top_k: int):
+                q_emb = np.asarray(q_emb, dtype="float32").reshape(1, self.dimension)
+                with self._lock, timed("embedding_search"):
+                    k = min(top_k, len(self.id_map))
+                    if k <= 0:
+                        return []
+                    scores, indices = self.index.search(q_emb, k)
+                    id_map = self.id_map
+                    return [
+                        {"id": id_map[i], "score": float(scores[0][j])}
+                        for j, i in enumerate(indices[0])
+                        if 0 <= i < len(id_map)
+                    ]
 
             def add_resume(self, id: int, text: str):
-                emb = self.model.encode([text], normalize_embeddings=True)
-                self.index.add(emb.astype("float32"))
-                self.id_map.append(id)
+                self._add_vectors([id], [self.batcher.encode(text)])
+
+            async def add_resume_async(self, id: int, text: str):
+                self._add_vectors([id], [await self.batcher.encode_async(text)])
+
+            def add_resumes(self, ids: list[int], texts: list[str]):
+                """Bulk add; the batcher splits the texts into full-size batches."""
+                if not ids:
+                    return
+                futures = [self.batcher.submit(text) for text in texts]
+                self._add_vectors(ids, [f.result() for f in futures])
+
+            def _check_ready(self):
+                if self._loader is None:
+                    # Standalone use (scripts, shell): load synchronously on first search
+                    self.start()
+                    self._finished.wait()
+                if not self.is_ready:
+                    raise EmbeddingsNotReady(self.load_error or "Embedding model is still loading")
 
             def search(self, query: str, top_k: int = 5):
-                q_emb = self.model.encode([query], normalize_embeddings=True).astype("float32")
-                scores, indices = self.index.search(q_emb, min(top_k, len(self.id_map)))
-                return [
-                    {"id": self.id_map[i], "score": float(scores[0][j])}
-                    for j, i in enumerate(indices[0])
-                    if 0 <= i < len(self.id_map)
-                ]
+                self._check_ready()
+                key = normalize_query(query)
+                q_emb = self.query_cache.get(key)
+                if q_emb is None:
+                    q_emb = self.batcher.encode(query)
+                    self.query_cache.set(key, q_emb)
+                return self._search_vector(q_emb, top_k)
+
+            async def search_async(self, query: str, top_k: int = 5):
+                self._check_ready()
+                key = normalize_query(query)
+                q_emb = self.query_cache.get(key)
+                if q_emb is None:
+                    q_emb = await self.batcher.encode_async(query)
+                    self.query_cache.set(key, q_emb)
+                return self._search_vector(q_emb, top_k)
+
+            def embed(self, text: str) -> bytes:
+                """float32 embedding of ``text`` as bytes, for storing next to a row (e.g. a job profile)."""
+                return np.asarray(self.batcher.encode(text), dtype="float32").tobytes()
+
+            async def embed_async(self, text: str) -> bytes:
+                return np.asarray(await self.batcher.encode_async(text), dtype="float32").tobytes()
+
+            def search_by_vector(self, vector: bytes, top_k: int = 5):
+                """Search with a stored embedding (see ``embed``); no model inference."""
+                self._check_ready()
+                return self._search_vector(np.frombuffer(vector, dtype="float32"), top_k)
+
+            def close(self):
+                self.batcher.close()
 
     except ImportError:
         EMBEDDINGS_ENABLED = False
@@ -48,7 +292,10 @@ if EMBEDDINGS_ENABLED:
 _instance = None
 
 def get_embeddings_service():
-    """Returns a singleton EmbeddingsService if enabled, else None."""
+    """Returns a singleton EmbeddingsService if enabled, else None.
+
+    Cheap to call at import time: the model is only loaded by ``start()``.
+    """
     global _instance
     if EMBEDDINGS_ENABLED:
         if _instance is None:
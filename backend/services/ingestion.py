@@ -0,0 +1,411 @@
+"""
+Bulk ingestion of resume PDFs from a ZIP archive or a directory.
+
+Files stream through a batched pipeline:
+
+1. read + sha256; skip files already in the checkpoint, repeated within the run,
+   or already stored as a ResumeDocument (with an owner, those are attached to
+   them instead)
+2. text extraction with PdfParser on a process pool
+3. optional parse_resume, spaced to a requests-per-minute budget so the Groq
+   rate limit is respected
+4. one INSERT per batch of documents (and, with an owner, of their reviews)
+5. one FAISS add per batch, when an embeddings service is passed in
+
+After each committed batch the source names are appended to the checkpoint
+file, so an interrupted run picks up where it stopped.
+
+CLI (documents then get indexed by each API worker at its next start):
+
+    python -m services.ingestion /data/cvs.zip --parse --parse-rpm 30 --owner client@example.com
+
+The admin endpoint (routes/admin.py) runs the same pipeline in the API process
+and also adds the new documents to that worker's FAISS index.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from config import get_settings
+from models.db import ResumeDocument, ResumeReview, SessionLocal, User
+from services.document_store import content_hash
+from services.parser import PdfParser
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+MAX_ERRORS_KEPT = 100
+
+
+def iter_pdfs(source: str) -> Iterator[tuple[str, bytes]]:
+    """Yield (name, bytes) for every .pdf in a ZIP archive or under a directory, in a stable order."""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if not info.is_dir() and info.filename.lower().endswith(".pdf"):
+                    yield info.filename, archive.read(info)
+    elif os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as f:
+                        yield os.path.relpath(path, source), f.read()
+    else:
+        raise ValueError(f"{source} is neither a ZIP archive nor a directory")
+
+
+_pdf_parser = None
+
+
+def extract_pdf(content: bytes) -> tuple[str | None, str | None]:
+    """Process-pool worker: (text, None) or (None, error)."""
+    global _pdf_parser
+    if _pdf_parser is None:
+        _pdf_parser = PdfParser()
+    try:
+        text = _pdf_parser.extract_text(content)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    if not text or not text.strip():
+        return None, "no extractable text"
+    return text, None
+
+
+class RateScheduler:
+    """Spaces calls evenly to at most `per_minute` starts per minute (thread-safe)."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class Checkpoint:
+    """Append-only file of source names whose batch has been committed."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self.done = set()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {line.rstrip("\n") for line in f if line.strip()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.done
+
+    def add(self, names: list[str]):
+        self.done.update(names)
+        if self.path and names:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{n}\n" for n in names)
+                f.flush()
+                os.fsync(f.fileno())
+
+
+@dataclass
+class IngestStats:
+    files: int = 0
+    skipped_checkpoint: int = 0
+    duplicates: int = 0
+    extracted: int = 0
+    failed: int = 0
+    parsed: int = 0
+    parse_failed: int = 0
+    inserted: int = 0
+    attached: int = 0  # already stored documents given to the owner
+    indexed: int = 0
+    elapsed_s: float = 0.0
+    errors: list = field(default_factory=list)
+
+    def error(self, name: str, message: str):
+        if len(self.errors) < MAX_ERRORS_KEPT:
+            self.errors.append({"file": name, "error": message})
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _existing_documents(db, digests: list[str]) -> dict[str, int]:
+    """content_hash -> id of the already stored documents among `digests`."""
+    rows = db.execute(select(ResumeDocument.content_hash, ResumeDocument.id).filter(ResumeDocument.content_hash.in_(digests)))
+    return dict(rows.all())
+
+
+def _attach_documents(db, named_ids: list[tuple[str, int]], owner_id: int) -> int:
+    """Give the owner a review of each (name, document id) they do not have one of yet; returns how many."""
+    if not named_ids:
+        return 0
+    owned = set(db.scalars(
+        select(ResumeReview.document_id)
+        .filter(ResumeReview.user_id == owner_id, ResumeReview.document_id.in_({i for _, i in named_ids}))
+    ))
+    reviews = []
+    for name, document_id in named_ids:
+        if document_id not in owned:
+            owned.add(document_id)
+            reviews.append(ResumeReview(filename=os.path.basename(name), document_id=document_id, user_id=owner_id))
+    db.add_all(reviews)
+    db.commit()
+    return len(reviews)
+
+
+def _insert_documents(db, rows: list[dict], owner_id: int | None) -> list[tuple[ResumeDocument, str]]:
+    """Insert a batch; if another writer stored some of the same files meanwhile, insert row by row."""
+    documents = [ResumeDocument(content_hash=r["digest"], raw_text=r["text"], parsed_resume=r["parsed"]) for r in rows]
+    try:
+        db.add_all(documents)
+        db.flush()
+        inserted = list(zip(documents, [r["text"] for r in rows]))
+        if owner_id is not None:
+            db.add_all([ResumeReview(filename=os.path.basename(r["name"]), document_id=d.id, user_id=owner_id)
+                        for r, d in zip(rows, documents)])
+        db.commit()
+        return inserted
+    except IntegrityError:
+        db.rollback()
+    inserted = []
+    for r in rows:
+        document = ResumeDocument(content_hash=r["digest"], raw_text=r["text"], parsed_resume=r["parsed"])
+        db.add(document)
+        try:
+            db.flush()
+            if owner_id is not None:
+                db.add(ResumeReview(filename=os.path.basename(r["name"]), document_id=document.id, user_id=owner_id))
+            db.commit()
+            inserted.append((document, r["text"]))
+        except IntegrityError:
+            db.rollback()
+    return inserted
+
+
+def ingest(
+    source: str,
+    *,
+    batch_size: int | None = None,
+    workers: int | None = None,
+    parse: bool = False,
+    parse_rpm: float | None = None,
+    parse_concurrency: int = 4,
+    checkpoint_path: str | None = None,
+    owner_id: int | None = None,
+    embeddings=None,
+    ai_service=None,
+    stats: IngestStats | None = None,
+    should_stop=lambda: False,
+) -> IngestStats:
+    """
+    Run the pipeline over `source` and return its counters (`stats` is updated in place,
+    so another thread can watch progress). `owner_id` attaches every document of the source,
+    new or already stored, to that user as a review without analysis, so it shows up in
+    their history and search.
+    """
+    batch_size = batch_size or settings.INGEST_BATCH_SIZE
+    workers = workers or settings.INGEST_WORKERS
+    stats = stats or IngestStats()
+    checkpoint = Checkpoint(checkpoint_path)
+    scheduler = RateScheduler(parse_rpm if parse_rpm is not None else settings.INGEST_PARSE_RPM)
+    if parse and ai_service is None:
+        from services.ai_service import AIService
+        ai_service = AIService()
+
+    def parse_one(text: str):
+        scheduler.wait()
+        return ai_service.parse_resume(text)
+
+    start = time.perf_counter()
+    seen = set()
+    # spawn, not fork: the admin endpoint runs this next to the event loop, DB pools and
+    # other threads, and a forked child can inherit one of their locks held forever
+    spawn = multiprocessing.get_context("spawn")
+    with SessionLocal() as db, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as extract_pool, \
+            ThreadPoolExecutor(max_workers=parse_concurrency, thread_name_prefix="ingest-parse") as parse_pool:
+        batch = []
+        entries = iter_pdfs(source)
+        while True:
+            entry = next(entries, None)
+            if entry is not None:
+                name, content = entry
+                stats.files += 1
+                if name in checkpoint:
+                    stats.skipped_checkpoint += 1
+                    continue
+                batch.append((name, content))
+                if len(batch) < batch_size:
+                    continue
+            if batch:
+                _process_batch(batch, db, seen, checkpoint, stats, extract_pool,
+                               parse_pool if parse else None, parse_one, owner_id, embeddings)
+                batch = []
+                stats.elapsed_s = round(time.perf_counter() - start, 2)
+                logger.info("ingest %s: %s", source, {k: v for k, v in stats.as_dict().items() if k != "errors"})
+            if entry is None or should_stop():
+                break
+    stats.elapsed_s = round(time.perf_counter() - start, 2)
+    return stats
+
+
+def _process_batch(batch, db, seen, checkpoint, stats, extract_pool, parse_pool, parse_one, owner_id, embeddings):
+    digests = [content_hash(content) for _, content in batch]
+    existing = _existing_documents(db, list(set(digests)))
+    todo = []
+    known = []  # (name, id) of files stored before this run, for the owner
+    for (name, content), digest in zip(batch, digests):
+        if digest in existing or digest in seen:
+            stats.duplicates += 1
+            if digest in existing:
+                known.append((name, existing[digest]))
+            continue
+        seen.add(digest)
+        todo.append({"name": name, "content": content, "digest": digest, "parsed": None})
+
+    for row, (text, error) in zip(todo, extract_pool.map(extract_pdf, [r.pop("content") for r in todo], chunksize=4)):
+        row["text"] = text
+        if error:
+            stats.failed += 1
+            stats.error(row["name"], error)
+        else:
+            stats.extracted += 1
+    todo = [r for r in todo if r["text"]]
+
+    if parse_pool is not None and todo:
+        futures = [parse_pool.submit(parse_one, r["text"]) for r in todo]
+        for row, future in zip(todo, futures):
+            try:
+                row["parsed"] = future.result()
+                stats.parsed += 1
+            except Exception as e:
+                # Stored unparsed; the first review/match of the document fills the parse in
+                stats.parse_failed += 1
+                stats.error(row["name"], f"parse_resume: {e}")
+
+    inserted = _insert_documents(db, todo, owner_id) if todo else []
+    stats.inserted += len(inserted)
+    stats.duplicates += len(todo) - len(inserted)
+    if owner_id is not None:
+        stored = {d.content_hash for d, _ in inserted}
+        raced = [r["digest"] for r in todo if r["digest"] not in stored]
+        if raced:
+            # Stored by another writer since the lookup above
+            ids = _existing_documents(db, raced)
+            known += [(r["name"], ids[r["digest"]]) for r in todo if r["digest"] in ids]
+        stats.attached += _attach_documents(db, known, owner_id)
+
+    if embeddings and inserted:
+        try:
+            embeddings.add_resumes([d.id for d, _ in inserted], [text for _, text in inserted])
+            stats.indexed += len(inserted)
+        except Exception as e:
+            stats.error("<faiss>", str(e))
+    checkpoint.add([name for name, _ in batch])
+
+
+@dataclass
+class IngestJob:
+    id: str
+    source: str
+    status: str = "running"  # running | finished | failed | cancelled
+    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    finished_at: str | None = None
+    error: str | None = None
+    stats: IngestStats = field(default_factory=IngestStats)
+    cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id, "source": self.source, "status": self.status, "started_at": self.started_at,
+            "finished_at": self.finished_at, "error": self.error, "stats": self.stats.as_dict(),
+        }
+
+
+_jobs: dict[str, IngestJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def start_job(source: str, cleanup: bool = False, label: str | None = None, **options) -> IngestJob:
+    """Run ingest() on a background thread; one job at a time per process. `cleanup` deletes `source` afterwards."""
+    with _jobs_lock:
+        if any(job.status == "running" for job in _jobs.values()):
+            raise RuntimeError("an ingestion job is already running")
+        job = IngestJob(id=uuid.uuid4().hex[:12], source=label or os.path.basename(source))
+        _jobs[job.id] = job
+
+    def run():
+        try:
+            ingest(source, stats=job.stats, should_stop=job.cancel.is_set, **options)
+            job.status = "cancelled" if job.cancel.is_set() else "finished"
+        except Exception as e:
+            logger.exception("ingestion job %s failed", job.id)
+            job.status, job.error = "failed", str(e)
+        finally:
+            job.finished_at = datetime.utcnow().isoformat()
+            if cleanup:
+                try:
+                    os.remove(source)
+                except OSError:
+                    pass
+
+    threading.Thread(target=run, name=f"ingest-{job.id}", daemon=True).start()
+    return job
+
+
+def get_job(job_id: str) -> IngestJob | None:
+    return _jobs.get(job_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="ZIP archive or directory of PDFs")
+    parser.add_argument("--batch-size", type=int, default=settings.INGEST_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=settings.INGEST_WORKERS, help="extraction processes")
+    parser.add_argument("--parse", action="store_true", help="run parse_resume on each new document")
+    parser.add_argument("--parse-rpm", type=float, default=settings.INGEST_PARSE_RPM,
+                        help="max parse_resume calls per minute (0 = unlimited)")
+    parser.add_argument("--parse-concurrency", type=int, default=4)
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <source>.ingest-checkpoint)")
+    parser.add_argument("--owner", help="email of the user the resumes are attached to")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    owner_id = None
+    if args.owner:
+        with SessionLocal() as db:
+            owner_id = db.scalar(select(User.id).filter(User.email == args.owner))
+        if owner_id is None:
+            parser.error(f"no user with email {args.owner}")
+
+    stats = ingest(
+        args.source, batch_size=args.batch_size, workers=args.workers, parse=args.parse,
+        parse_rpm=args.parse_rpm, parse_concurrency=args.parse_concurrency,
+        checkpoint_path=args.checkpoint or f"{args.source.rstrip(os.sep)}.ingest-checkpoint", owner_id=owner_id,
+    )
+    summary = {k: v for k, v in stats.as_dict().items() if k != "errors"}
+    print(summary)
+    for error in stats.errors:
+        print(f"  {error['file']}: {error['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Saved job profiles.
+
+Recruiters match many resumes against the same few job descriptions. A JobProfile
+stores the description once together with everything the match path derives from
+it - the keyword set, the compressed prompt excerpt, the required-skills list and
+the embedding - so /match-resume with a `job_id` only does the resume-side work.
+"""
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.db import JobProfile
+from services.matching_service import MatchingService
+
+
+@dataclass
+class JobSpec:
+    """The job side of a match: description plus its keywords, prompt excerpt and skills."""
+
+    description: str
+    keywords: set[str]
+    excerpt: str | None = None  # None: compress the description when building the prompt
+    skills: list[str] = field(default_factory=list)
+    profile_id: int | None = None
+
+
+def spec_from_text(description: str) -> JobSpec:
+    """Ad-hoc job description sent with the request; nothing precomputed beyond keywords."""
+    return JobSpec(description=description, keywords=MatchingService.extract_keywords(description))
+
+
+def spec_from_profile(profile: JobProfile) -> JobSpec:
+    return JobSpec(
+        description=profile.description,
+        keywords=set(profile.keywords or []),
+        excerpt=profile.prompt_excerpt,
+        skills=profile.skills or [],
+        profile_id=profile.id,
+    )
+
+
+def prepare_profile(profile: JobProfile, ai_service, emb_service=None):
+    """
+    Fill in the precomputed fields from title/description (blocking: one LLM call and,
+    with embeddings enabled, one encode). Run on create and whenever the description changes.
+    While the embedding model is still loading the embedding is left empty; semantic
+    search fills it in on first use.
+    """
+    profile.keywords = sorted(MatchingService.extract_keywords(profile.description))
+    profile.prompt_excerpt = ai_service.compressor.compress_job(profile.description, "job_profile")
+    profile.skills = ai_service.extract_job_skills(profile.description)
+    profile.embedding = profile.embedding_model = None
+    if emb_service and emb_service.is_ready:
+        refresh_embedding(profile, emb_service)
+
+
+def refresh_embedding(profile: JobProfile, emb_service) -> bool:
+    """(Re)compute the embedding if it is missing or from another model. Returns True if it changed."""
+    if profile.embedding is not None and profile.embedding_model == emb_service.model_name:
+        return False
+    profile.embedding = emb_service.embed(f"{profile.title}\n{profile.description}")
+    profile.embedding_model = emb_service.model_name
+    return True
+
+
+async def get_profile(db: AsyncSession, user_id: int, job_id: int) -> JobProfile | None:
+    result = await db.execute(select(JobProfile).filter(JobProfile.id == job_id, JobProfile.user_id == user_id))
+    return result.scalars().first()
+
+
+def as_dict(profile: JobProfile, full: bool = True) -> dict:
+    item = {
+        "id": profile.id,
+        "title": profile.title,
+        "skills": profile.skills or [],
+        "created_at": profile.created_at.isoformat() if profile.created_at else None,
+        "updated_at": profile.updated_at.isoformat() if profile.updated_at else None,
+    }
+    if full:
+        item.update(
+            description=profile.description,
+            keywords=profile.keywords or [],
+        )
+    return item
@@ -1,6 +1,8 @@
 """Resume-job matching logic (keyword + AI hybrid)."""
 import re
 
+import numpy as np
+
 
 class MatchingService:
     """Computes match score and skill gaps."""
@@ -27,3 +29,8 @@ class MatchingService:
     ) -> float:
         """Blend keyword score with AI score."""
         return keyword_score_val * (1 - ai_weight) + ai_score * ai_weight
+
+    @staticmethod
+    def hybrid_scores(keyword_scores: np.ndarray, ai_scores: np.ndarray, ai_weight: float) -> np.ndarray:
+        """compute_hybrid_score over whole arrays (bulk re-scoring), rounded like stored scores."""
+        return np.round(keyword_scores * (1 - ai_weight) + ai_scores * ai_weight, 1)
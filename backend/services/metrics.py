@@ -0,0 +1,163 @@
+"""
+Low-overhead in-process metrics, exposed in Prometheus text format at /metrics.
+
+- STAGE_SECONDS: latency histogram per hot-path stage (pdf_extract, llm_*,
+  keyword_score, embedding_encode, embedding_search, db_commit)
+- LLM_TOKENS: prompt/completion tokens reported by Groq per call type
+- LLM_FALLBACKS: fused review+parse replies that failed validation
+- PDF_BACKEND_FAILURES: PDF extraction backend errors / empty results
+- PROMPT_TOKENS_SAVED: estimated input tokens removed by the prompt compressor per call type
+- cache hit/miss counters for every cache registered with register_cache()
+
+Metrics are per process; with several gunicorn workers, each worker reports its own.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines += [f"{self.name}{_format_labels(k)} {v}" for k, v in items]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            if i < len(self.buckets):
+                series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def time(self, **labels) -> "Timer":
+        return Timer(self, labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for key, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, series):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', bound),))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series[-1]}")
+        return lines
+
+
+class Timer:
+    """Context manager recording elapsed wall time into a histogram."""
+
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class HitStats:
+    """Hit/miss tally for lookups that aren't backed by one of the cache classes."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+
+STAGE_SECONDS = Histogram("resume_matcher_stage_seconds", "Latency of hot-path stages in seconds.")
+LLM_TOKENS = Counter("resume_matcher_llm_tokens_total", "LLM tokens used, by call and kind (prompt/completion).")
+LLM_ERRORS = Counter("resume_matcher_llm_errors_total", "Failed LLM calls, by call.")
+LLM_FALLBACKS = Counter(
+    "resume_matcher_llm_fallbacks_total", "Fused LLM replies that failed validation and fell back to separate calls."
+)
+PDF_BACKEND_FAILURES = Counter(
+    "resume_matcher_pdf_backend_failures_total",
+    "PDF extractions that raised or returned no text (and fell through to the next backend), by backend.",
+)
+PROMPT_TOKENS_SAVED = Counter(
+    "resume_matcher_prompt_tokens_saved_total", "Estimated prompt tokens removed by compression, by call."
+)
+
+_metrics = [STAGE_SECONDS, LLM_TOKENS, LLM_ERRORS, LLM_FALLBACKS, PDF_BACKEND_FAILURES, PROMPT_TOKENS_SAVED]
+_caches = {}
+
+
+def timed(stage: str) -> Timer:
+    """`with timed("pdf_extract"): ...` records the block's latency under that stage."""
+    return Timer(STAGE_SECONDS, {"stage": stage})
+
+
+def record_llm_usage(call: str, usage):
+    """Count tokens from a Groq completion's `usage` (if the response has one)."""
+    if usage is None:
+        return
+    LLM_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, call=call, kind="prompt")
+    LLM_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, call=call, kind="completion")
+
+
+def register_cache(name: str, cache):
+    """Expose hit/miss counts of any object with `hits` and `misses` attributes."""
+    _caches[name] = cache
+
+
+def render() -> str:
+    lines = []
+    for metric in _metrics:
+        lines += metric.render()
+    if _caches:
+        name = "resume_matcher_cache_requests_total"
+        lines += [f"# HELP {name} Cache lookups by cache and result.", f"# TYPE {name} counter"]
+        for cache_name, cache in sorted(_caches.items()):
+            lines.append(f'{name}{{cache="{cache_name}",result="hit"}} {cache.hits}')
+            lines.append(f'{name}{{cache="{cache_name}",result="miss"}} {cache.misses}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,39 @@
+"""Keyset (cursor) pagination over (timestamp, id) for the history endpoints."""
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import literal, tuple_
+
+
+def encode_cursor(timestamp: datetime, id: int) -> str:
+    """Opaque cursor pointing just past the given row."""
+    raw = f"{timestamp.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts), int(id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(400, "Invalid cursor")
+
+
+def paginate(query, timestamp_col, id_col, cursor: str | None, limit: int):
+    """
+    Newest-first page of `query`. Returns (rows, next_cursor); next_cursor is None
+    on the last page. Rows must expose `timestamp` and `id` attributes.
+    Backed by the composite (user_id, timestamp, id) indexes.
+    """
+    if cursor:
+        ts, id = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(timestamp_col, id_col) < tuple_(literal(ts, timestamp_col.type), literal(id, id_col.type))
+        )
+    rows = query.order_by(timestamp_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].timestamp, rows[-1].id)
@@ -1,18 +1,104 @@
-"""PDF parsing service."""
+"""
+PDF parsing service.
+
+Text extraction is pluggable. PDF_BACKENDS lists backends in order of preference
+(e.g. "pymupdf,pypdf"); each document goes to the first one that is installed,
+and if it raises or returns no text the next one is tried.
+
+- pypdf: pure Python, always installed; slowest, and merges the lines of multi-column layouts
+- pymupdf: MuPDF bindings (pip install pymupdf); much faster, keeps column blocks together
+- pdfminer: pdfminer.six layout analysis (pip install pdfminer.six); best reading order, slow
+- pdfium: pypdfium2 (pip install pypdfium2); fast, Chrome's PDF engine
+"""
 import io
+import logging
+
+from config import get_settings
+from services.metrics import PDF_BACKEND_FAILURES, timed
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_pypdf(content: bytes) -> str:
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_pymupdf(content: bytes) -> str:
+    import pymupdf
+
+    with pymupdf.open(stream=content, filetype="pdf") as doc:
+        return "\n".join(page.get_text() for page in doc)
+
 
-from pypdf import PdfReader
+def _extract_pdfminer(content: bytes) -> str:
+    from pdfminer.high_level import extract_text
+
+    return extract_text(io.BytesIO(content))
+
+
+def _extract_pdfium(content: bytes) -> str:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(content)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(pages)
+    finally:
+        pdf.close()
+
+
+BACKENDS = {
+    "pypdf": (_extract_pypdf, "pypdf"),
+    "pymupdf": (_extract_pymupdf, "pymupdf"),
+    "pdfminer": (_extract_pdfminer, "pdfminer"),
+    "pdfium": (_extract_pdfium, "pypdfium2"),
+}
+
+
+def available_backends() -> list[str]:
+    """Backends whose library can be imported here."""
+    import importlib.util
+
+    return [name for name, (_, module) in BACKENDS.items() if importlib.util.find_spec(module) is not None]
 
 
 class PdfParser:
     """Extract text from PDF files."""
 
-    @staticmethod
-    def extract_text(content: bytes) -> str:
-        """Extract raw text from PDF bytes."""
-        pdf_stream = io.BytesIO(content)
-        reader = PdfReader(pdf_stream)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
-        return text.strip()
+    def __init__(self, backends: list[str] | None = None):
+        if backends is None:
+            backends = get_settings().PDF_BACKENDS
+        unknown = [b for b in backends if b not in BACKENDS]
+        if unknown:
+            raise ValueError(f"Unknown PDF backend(s): {', '.join(unknown)}; choose from {', '.join(BACKENDS)}")
+        installed = set(available_backends())
+        missing = [b for b in backends if b not in installed]
+        if missing:
+            logger.warning(f"PDF backend(s) not installed, skipping: {', '.join(missing)}")
+        self.backends = [b for b in backends if b in installed] or ["pypdf"]
+
+    def extract_text(self, content: bytes) -> str:
+        """Extract raw text from PDF bytes with the first backend that succeeds."""
+        with timed("pdf_extract"):
+            error = None
+            for name in self.backends:
+                try:
+                    text = BACKENDS[name][0](content).strip()
+                except Exception as e:
+                    PDF_BACKEND_FAILURES.inc(backend=name)
+                    error = e
+                    continue
+                if text:
+                    return text
+                PDF_BACKEND_FAILURES.inc(backend=name)
+            if error is not None:
+                raise error
+            return ""
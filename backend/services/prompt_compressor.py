@@ -0,0 +1,244 @@
+"""Section-aware compression of resume and job description text before it goes into an LLM prompt."""
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from services.metrics import PROMPT_TOKENS_SAVED
+
+# Section headings and how much each is worth to a call; unknown sections rank between.
+# Lower number = kept first when the budget is tight.
+RESUME_SECTIONS = {
+    "summary": ("summary", "profile", "objective", "about me", "professional summary", "career summary"),
+    "skills": ("skills", "technical skills", "core competencies", "competencies", "technologies", "tech stack",
+               "tools", "expertise", "key skills"),
+    "experience": ("experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "career history"),
+    "projects": ("projects", "personal projects", "selected projects", "key projects"),
+    "education": ("education", "academic background", "qualifications"),
+    "certifications": ("certifications", "certificates", "licenses", "courses", "training"),
+    "achievements": ("achievements", "awards", "honors", "accomplishments"),
+    "publications": ("publications", "research"),
+    "languages": ("languages",),
+    "volunteering": ("volunteering", "volunteer experience", "leadership"),
+    "interests": ("interests", "hobbies", "activities"),
+    "references": ("references", "referees"),
+}
+JOB_SECTIONS = {
+    "requirements": ("requirements", "qualifications", "minimum qualifications", "basic qualifications",
+                     "what you'll need", "what we're looking for", "who you are", "must have", "skills"),
+    "preferred": ("preferred qualifications", "nice to have", "bonus points", "preferred"),
+    "responsibilities": ("responsibilities", "what you'll do", "the role", "role", "your role", "duties",
+                         "key responsibilities", "about the role"),
+    "about": ("about us", "about the company", "who we are", "our mission", "company"),
+    "benefits": ("benefits", "perks", "what we offer", "compensation", "salary"),
+    "legal": ("equal opportunity", "eeo statement", "diversity", "privacy notice"),
+}
+
+PRIORITIES = {
+    "review": ["experience", "skills", "summary", "projects", "education", "achievements", "certifications",
+               None, "publications", "volunteering", "languages", "interests", "references"],
+    "parse": ["skills", "experience", "education", "summary", "projects", "certifications", "achievements",
+              None, "languages", "publications", "volunteering", "interests", "references"],
+    "match": ["skills", "experience", "summary", "projects", "certifications", "education", "achievements",
+              None, "publications", "languages", "volunteering", "interests", "references"],
+    "job": ["requirements", "responsibilities", "preferred", None, "about", "benefits", "legal"],
+}
+
+_CONTACT = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.]+"                      # email
+    r"|(?:https?://|www\.)\S+"                      # URL
+    r"|\b(?:linkedin|github)\.com/\S*",
+    re.IGNORECASE,
+)
+# Phone-like runs; only treated as contact details with 10+ digits so date ranges survive
+_PHONE = re.compile(r"\+?\(?\d[\d\s().-]{7,}\d")
+_PAGE_MARKER = re.compile(r"^(?:page\s*)?\d+\s*(?:/|of)\s*\d+$|^page\s*\d+$|^-?\s*\d+\s*-?$", re.IGNORECASE)
+_BOILERPLATE = re.compile(
+    r"references available upon request|curriculum vitae|^resume$|^cv$"
+    r"|is an equal opportunity employer|without regard to race|reasonable accommodation",
+    re.IGNORECASE,
+)
+_SPACES = re.compile(r"[ \t ]+")
+_BULLETS = re.compile(r"^[•·▪◦●■\-*–]+\s*")
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+# Lines longer than this (pasted paragraphs, text extracted without line breaks) are
+# split into sentences so sections can be cut line by line
+LONG_LINE_CHARS = 300
+
+
+def _strip_phone(match: re.Match) -> str:
+    return "" if sum(c.isdigit() for c in match.group(0)) >= 10 else match.group(0)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough Llama token count (~4 characters per token); good enough for budgeting."""
+    return (len(text) + 3) // 4
+
+
+def truncate_to_tokens(text: str, tokens: int) -> str:
+    """Head of `text` within `tokens`, cut at a word boundary."""
+    limit = tokens * 4
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    space = cut.rfind(" ")
+    return cut[:space] if space > limit // 2 else cut
+
+
+def split_long_line(line: str) -> list[str]:
+    if len(line) <= LONG_LINE_CHARS:
+        return [line]
+    pieces = []
+    for sentence in _SENTENCE_END.split(line):
+        while len(sentence) > LONG_LINE_CHARS:
+            head = truncate_to_tokens(sentence, LONG_LINE_CHARS // 4)
+            pieces.append(head)
+            sentence = sentence[len(head):].lstrip()
+        if sentence:
+            pieces.append(sentence)
+    return pieces
+
+
+@dataclass
+class CompressedText:
+    text: str
+    original_tokens: int
+    tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.original_tokens - self.tokens)
+
+
+class PromptCompressor:
+    """
+    Shrinks resume / job description text to a token budget:
+
+    1. normalize whitespace and bullets, drop empty lines, split paragraph-long lines
+       into sentences
+    2. drop boilerplate: page numbers, repeats of running headers/footers, contact
+       details, "references available upon request", EEO statements
+    3. split into sections by heading and keep the most valuable ones for the call
+       (e.g. skills first when matching), truncating the last one that doesn't fit,
+       then restore document order
+
+    If nothing survives, the head of the text is used instead. With `enabled=False`
+    the text is only truncated to the budget.
+    """
+
+    def __init__(self, resume_budget: int, job_budget: int, enabled: bool = True):
+        self.resume_budget = resume_budget
+        self.job_budget = job_budget
+        self.enabled = enabled
+
+    def compress_resume(self, text: str, call: str, purpose: str = "review", budget: int | None = None) -> str:
+        return self._compress(text, call, RESUME_SECTIONS, PRIORITIES[purpose], budget or self.resume_budget)
+
+    def compress_job(self, text: str, call: str, budget: int | None = None) -> str:
+        return self._compress(text, call, JOB_SECTIONS, PRIORITIES["job"], budget or self.job_budget)
+
+    def _compress(self, text: str, call: str, headings: dict, priority: list, budget: int) -> str:
+        if not text:
+            return text
+        if not self.enabled:
+            # No section selection, but the budget still caps what reaches the LLM
+            return truncate_to_tokens(text, budget)
+        result = self.compress(text, headings, priority, budget)
+        PROMPT_TOKENS_SAVED.inc(result.saved_tokens, call=call)
+        return result.text
+
+    @classmethod
+    def compress(cls, text: str, headings: dict, priority: list, budget: int) -> CompressedText:
+        original = estimate_tokens(text)
+        lines = cls.clean_lines(text)
+        sections = cls.split_sections(lines, headings)
+        kept = cls.select(sections, priority, budget)
+        out = "\n".join(line for _, body in kept for line in body)
+        if not out and text.strip():
+            # Nothing survived cleaning/selection: a plain head slice beats an empty prompt
+            out = truncate_to_tokens(" ".join(text.split()), budget)
+        return CompressedText(out, original, estimate_tokens(out))
+
+    @staticmethod
+    def clean_lines(text: str) -> list[str]:
+        lines = []
+        for raw in text.splitlines():
+            line = _SPACES.sub(" ", raw).strip()
+            line = _BULLETS.sub("- ", line) if _BULLETS.match(line) else line
+            if line:
+                lines.extend(split_long_line(line))
+        # Short lines that recur (running headers/footers across pages) are kept once
+        counts = Counter(lines)
+        repeated = {l for l, n in counts.items() if n >= 3 and len(l) < 80}
+        seen = set()
+        cleaned = []
+        for line in lines:
+            if line in repeated:
+                if line in seen:
+                    continue
+                seen.add(line)
+            if _PAGE_MARKER.match(line) or _BOILERPLATE.search(line):
+                continue
+            stripped = _PHONE.sub(_strip_phone, _CONTACT.sub("", line))
+            if stripped != line:
+                # Drop the contact details but keep any real content sharing the line
+                line = stripped.strip(" |,;•·-")
+                if len(line) < 25:
+                    continue
+            cleaned.append(line)
+        return cleaned
+
+    @staticmethod
+    def heading_of(line: str, headings: dict) -> str | None:
+        if len(line) > 40:
+            return None
+        key = line.rstrip(":").strip().lower()
+        for name, titles in headings.items():
+            if key in titles:
+                return name
+        return None
+
+    @classmethod
+    def split_sections(cls, lines: list[str], headings: dict) -> list[tuple[str | None, list[str]]]:
+        """[(section name or None for the preamble/unknown, lines incl. heading)] in document order."""
+        sections = [(None, [])]
+        for line in lines:
+            name = cls.heading_of(line, headings)
+            if name:
+                sections.append((name, [line]))
+            else:
+                sections[-1][1].append(line)
+        return [s for s in sections if s[1]]
+
+    @staticmethod
+    def select(sections: list, priority: list, budget: int) -> list:
+        rank = {name: i for i, name in enumerate(priority)}
+        fallback = rank.get(None, len(priority))
+        order = sorted(range(len(sections)), key=lambda i: (rank.get(sections[i][0], fallback), i))
+        remaining = budget
+        chosen = {}
+        for i in order:
+            if remaining <= 0:
+                break
+            name, body = sections[i]
+            cost = estimate_tokens("\n".join(body))
+            if cost <= remaining:
+                chosen[i] = body
+                remaining -= cost + 1
+                continue
+            # Partial section: whole lines up to the budget (keeps the heading and the top entries)
+            partial = []
+            for line in body:
+                line_cost = estimate_tokens(line) + 1
+                if line_cost > remaining:
+                    # Keep the head of the line that doesn't fit rather than nothing
+                    head = truncate_to_tokens(line, remaining - 1)
+                    if len(head) >= 40:
+                        partial.append(head)
+                    remaining = 0
+                    break
+                partial.append(line)
+                remaining -= line_cost
+            if len(partial) > (1 if name else 0):
+                chosen[i] = partial
+        return [(sections[i][0], chosen[i]) for i in sorted(chosen)]
@@ -0,0 +1,126 @@
+"""
+Bulk re-scoring of stored job matches after MATCH_AI_WEIGHT changes.
+
+JobMatch rows keep the keyword and AI components of their hybrid score, so a new
+weighting is arithmetic, not an LLM replay: rows are read in id-ordered chunks
+(only the score columns), re-blended with NumPy and written back with one
+executemany UPDATE per chunk, committed chunk by chunk.
+
+Rows already at the target weight are skipped, so an interrupted run can simply be
+restarted. Rows from before the components were stored only have the blended score
+and are left as they are (reported as `legacy`).
+
+    python -m services.rescoring --ai-weight 0.6 --dry-run
+    python -m services.rescoring                    # re-blend to MATCH_AI_WEIGHT
+"""
+import argparse
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import bindparam, func, or_, select, update
+
+from config import get_settings
+from models.db import JobMatch, SessionLocal
+from services.matching_service import MatchingService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RescoreStats:
+    ai_weight: float
+    rows: int = 0  # rows re-blended (or that would be, with dry_run)
+    changed: int = 0  # rows whose match_score moved
+    legacy: int = 0  # rows without stored components
+    mean_abs_change: float = 0.0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "rows_per_s": round(self.rows_per_s)}
+
+
+def rescore(ai_weight: float, chunk_size: int = 10_000, dry_run: bool = False, db=None) -> RescoreStats:
+    """Re-blend match_score for every row with stored components and a different weight."""
+    if not 0 <= ai_weight <= 1:
+        raise ValueError("ai_weight must be between 0 and 1")
+    table = JobMatch.__table__
+    # Core executemany: the ORM bulk-update path costs more than the UPDATE itself
+    write = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(match_score=bindparam("score"), score_weight=ai_weight, updated_at=bindparam("updated_at"))
+    )
+    own_session = db is None
+    db = db or SessionLocal()
+    stats = RescoreStats(ai_weight=ai_weight)
+    start = time.perf_counter()
+    total_change = 0.0
+    try:
+        stats.legacy = db.scalar(
+            select(func.count()).select_from(JobMatch)
+            .filter(or_(JobMatch.keyword_score.is_(None), JobMatch.ai_score.is_(None)))
+        )
+        stmt = (
+            select(JobMatch.id, JobMatch.keyword_score, JobMatch.ai_score, JobMatch.match_score)
+            .filter(
+                JobMatch.keyword_score.isnot(None),
+                JobMatch.ai_score.isnot(None),
+                or_(JobMatch.score_weight.is_(None), JobMatch.score_weight != ai_weight),
+            )
+            .order_by(JobMatch.id)
+            .limit(chunk_size)
+        )
+        last_id = 0
+        while True:
+            rows = db.execute(stmt.filter(JobMatch.id > last_id)).all()
+            if not rows:
+                break
+            data = np.array([tuple(r) for r in rows], dtype="float64")
+            ids = data[:, 0].astype("int64")
+            old = np.nan_to_num(data[:, 3], nan=-1.0)  # NULL match_score counts as changed
+            new = MatchingService.hybrid_scores(data[:, 1], data[:, 2], ai_weight)
+            delta = np.abs(new - old)
+            stats.rows += len(ids)
+            stats.changed += int(np.count_nonzero(delta >= 0.05))
+            total_change += float(delta.sum())
+            last_id = int(ids[-1])
+            if not dry_run:
+                # updated_at changes the /match-history ETag so clients drop cached scores
+                now = datetime.utcnow()
+                db.execute(write, [
+                    {"row_id": id, "score": score, "updated_at": now}
+                    for id, score in zip(ids.tolist(), new.tolist())
+                ])
+                db.commit()
+            logger.info("re-scored %d rows (up to id %d)", stats.rows, last_id)
+    finally:
+        if own_session:
+            db.close()
+    stats.seconds = round(time.perf_counter() - start, 3)
+    stats.mean_abs_change = round(total_change / stats.rows, 3) if stats.rows else 0.0
+    return stats
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Re-blend stored match scores with a new AI weight.")
+    parser.add_argument("--ai-weight", type=float, default=settings.MATCH_AI_WEIGHT,
+                        help="weight of the AI score in the hybrid (default: MATCH_AI_WEIGHT)")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per read / UPDATE batch")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    stats = rescore(args.ai_weight, chunk_size=args.chunk_size, dry_run=args.dry_run)
+    print(json.dumps(stats.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
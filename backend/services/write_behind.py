@@ -0,0 +1,230 @@
+"""
+Write-behind persistence for review and match results (optional, PostgreSQL only).
+
+With WRITE_BEHIND_ENABLED=true, handlers no longer wait for an INSERT + commit:
+the row's primary key is taken from a block of ids reserved up front from the
+table's sequence, the row is queued, and a background task flushes the queue in
+batched multi-row INSERT ... RETURNING statements every WRITE_BEHIND_FLUSH_MS (or
+as soon as WRITE_BEHIND_BATCH_SIZE rows are waiting).
+
+Trade-offs: a row becomes visible to /history up to one flush interval after the
+response, and rows still queued when a worker is killed (not shut down) are lost.
+The lifespan hook calls close(), which lets an in-flight flush finish and then
+flushes everything still queued on a normal shutdown, retrying CLOSE_FLUSH_ATTEMPTS
+times; rows it still cannot write are logged one by one at error level.
+
+The queue holds at most WRITE_BEHIND_MAX_QUEUE rows (queued plus being flushed).
+When the database falls that far behind, add() inserts the row itself before
+returning, which bounds memory and slows callers down to what the database takes.
+
+Each table/column-set group is inserted in its own transaction. If a group hits a
+row-level error (constraint violation, bad data), its rows are retried one by one so
+the bad row cannot hold back the rest; a row that fails MAX_ROW_ATTEMPTS times is
+dropped and logged. Connection errors keep every row queued for the next flush.
+"""
+import asyncio
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import insert, text
+from sqlalchemy.exc import DataError, IntegrityError
+
+from config import get_settings
+from models.db import async_engine
+from services.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+MAX_ROW_ATTEMPTS = 3
+CLOSE_FLUSH_ATTEMPTS = 3
+CLOSE_RETRY_DELAY = 1.0  # seconds, doubled after each failed attempt
+# Errors caused by the row itself; retrying it alongside other rows would fail them too
+ROW_ERRORS = (IntegrityError, DataError)
+
+
+@dataclass
+class QueuedRow:
+    table: object
+    values: dict
+    attempts: int = 0
+
+
+class WriteBehindWriter:
+    """Queues ORM rows and inserts them in batches on a background task."""
+
+    def __init__(self, engine, batch_size: int = 100, flush_interval_ms: float = 50, id_block_size: int = 100,
+                 max_queue: int = 10_000):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.id_block_size = id_block_size
+        self.max_queue = max_queue
+        self._pending = []  # QueuedRow
+        self._in_flight = 0  # rows taken off _pending by the running flush
+        self._id_pools = defaultdict(deque)  # table name -> reserved ids
+        self._id_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task = None
+
+    @staticmethod
+    def supports(engine) -> bool:
+        """Id reservation relies on PostgreSQL sequences."""
+        return engine.dialect.name == "postgresql"
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending) + self._in_flight
+
+    async def close(self):
+        """Stop the background task (without cancelling a flush in flight) and flush whatever is still queued."""
+        if self._task is not None:
+            self._closing = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        delay = CLOSE_RETRY_DELAY
+        for attempt in range(1, CLOSE_FLUSH_ATTEMPTS + 1):
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind: final flush attempt {attempt} failed ({len(self._pending)} rows queued): {e}")
+            if not self._pending:
+                return
+            if attempt < CLOSE_FLUSH_ATTEMPTS:
+                await asyncio.sleep(delay)
+                delay *= 2
+        for row in self._pending:
+            logger.error(
+                f"Write-behind: lost {row.table.name} row id={row.values.get('id')} "
+                f"user_id={row.values.get('user_id')} at shutdown"
+            )
+        self._pending = []
+
+    async def reserve_id(self, table) -> int:
+        pool = self._id_pools[table.name]
+        if not pool:
+            async with self._id_lock:
+                if not pool:
+                    async with self.engine.connect() as conn:
+                        result = await conn.execute(
+                            text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :n)"),
+                            {"table": table.name, "n": self.id_block_size},
+                        )
+                        pool.extend(row[0] for row in result)
+        return pool.popleft()
+
+    async def add(self, entry) -> int:
+        """Queue an unsaved ORM instance for insertion; returns its (reserved) id."""
+        table = entry.__table__
+        values = {c.key: getattr(entry, c.key) for c in table.columns}
+        if "timestamp" in values and values["timestamp"] is None:
+            values["timestamp"] = datetime.utcnow()  # request time, not flush time
+        values["id"] = entry.id = await self.reserve_id(table)
+        # Leave unset columns out so JSON columns stay SQL NULL rather than JSON null
+        row = QueuedRow(table, {k: v for k, v in values.items() if v is not None})
+        if self.queued >= self.max_queue:
+            # The database is falling behind: write this one now instead of growing the queue
+            with timed("db_commit"):
+                await self._insert(table, [row.values])
+            return entry.id
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return entry.id
+
+    async def flush(self):
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            self._in_flight = len(pending)
+            # executemany needs identical keys; with RETURNING, SQLAlchemy sends
+            # each group as multi-row INSERT ... VALUES (...), (...) RETURNING id
+            groups = defaultdict(list)
+            for row in pending:
+                groups[(row.table, frozenset(row.values))].append(row)
+            remaining = list(groups.values())
+            retry = []
+            try:
+                with timed("db_flush"):
+                    while remaining:
+                        rows = remaining[0]
+                        try:
+                            await self._insert(rows[0].table, [row.values for row in rows])
+                            remaining.pop(0)
+                        except ROW_ERRORS:
+                            remaining.pop(0)
+                            await self._insert_each(rows, retry)
+            finally:
+                # Whatever was not committed, including on cancellation, goes back to the queue
+                requeue = [row for rows in remaining for row in rows] + retry
+                if requeue:
+                    self._pending[:0] = requeue
+                self._in_flight = 0
+
+    async def _insert(self, table, values: list[dict]):
+        async with self.engine.begin() as conn:
+            result = await conn.execute(insert(table).returning(table.c.id), values)
+            inserted = len(result.all())
+            if inserted != len(values):
+                raise RuntimeError(f"{table.name}: inserted {inserted} of {len(values)} rows")
+
+    async def _insert_each(self, rows: list[QueuedRow], retry: list[QueuedRow]):
+        """Insert rows one per transaction, so only the bad ones fail; those go to `retry` or are dropped."""
+        for i, row in enumerate(rows):
+            try:
+                await self._insert(row.table, [row.values])
+            except ROW_ERRORS as e:
+                row.attempts += 1
+                if row.attempts >= MAX_ROW_ATTEMPTS:
+                    logger.error(
+                        f"Write-behind: dropping {row.table.name} row id={row.values.get('id')} "
+                        f"after {row.attempts} failed attempts: {e}"
+                    )
+                else:
+                    retry.append(row)
+            except BaseException:
+                retry.extend(rows[i:])
+                raise
+
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed ({len(self._pending)} rows queued): {e}")
+
+
+_instance = None
+
+def get_write_behind():
+    """Returns the singleton WriteBehindWriter if enabled and supported, else None."""
+    global _instance
+    settings = get_settings()
+    if not settings.WRITE_BEHIND_ENABLED:
+        return None
+    if _instance is None:
+        if not WriteBehindWriter.supports(async_engine):
+            logger.warning("WRITE_BEHIND_ENABLED is set but needs PostgreSQL; writing synchronously.")
+            return None
+        _instance = WriteBehindWriter(
+            async_engine,
+            batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval_ms=settings.WRITE_BEHIND_FLUSH_MS,
+            id_block_size=settings.WRITE_BEHIND_ID_BLOCK_SIZE,
+            max_queue=settings.WRITE_BEHIND_MAX_QUEUE,
+        )
+    return _instance
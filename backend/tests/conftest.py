@@ -0,0 +1,43 @@
+"""
+Test setup. Run from backend/: `python -m pytest tests`.
+
+Settings are read at import time, so the required ones are filled in here before
+any app module is imported: a throwaway SQLite database, dummy keys and a cheap
+bcrypt cost.
+"""
+import os
+import tempfile
+import uuid
+
+import pytest
+
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='resume-tests-'), 'test.db')}"
+)
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """TestClient on the app (rate limits off) against the test database."""
+    from fastapi.testclient import TestClient
+
+    import main
+    from models.db import init_db
+    from routes.resume import limiter
+
+    init_db()
+    monkeypatch.setattr(limiter, "enabled", False)
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def user(client):
+    """A freshly signed-up user: {"id", "email", "password", "headers"}."""
+    email, password = f"{uuid.uuid4().hex[:12]}@tests.example", "pw-123456"
+    user_id = client.post("/auth/signup", json={"email": email, "password": password}).json()["id"]
+    token = client.post("/auth/login", data={"username": email, "password": password}).json()["access_token"]
+    return {"id": user_id, "email": email, "password": password, "headers": {"Authorization": f"Bearer {token}"}}
@@ -0,0 +1,72 @@
+"""Bearer-token resolution: the token cache and the uid claim."""
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+
+from services import auth_service
+from services.auth_service import _token_cache, clear_token_cache, create_access_token
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_login_token_carries_the_user_id(client, user):
+    token = user["headers"]["Authorization"].split()[1]
+    payload = jwt.decode(token, auth_service.settings.SECRET_KEY, algorithms=[auth_service.settings.ALGORITHM])
+    assert payload["sub"] == user["email"]
+    assert payload["uid"] == user["id"]
+
+
+def test_repeat_requests_are_served_from_the_token_cache(client, user):
+    assert client.get("/history", headers=user["headers"]).status_code == 200
+    hits = _token_cache.hits
+
+    assert client.get("/history", headers=user["headers"]).status_code == 200
+    assert client.get("/history", headers=user["headers"]).status_code == 200
+    assert _token_cache.hits == hits + 2
+
+
+def test_uid_that_does_not_match_the_email_is_rejected(client, user):
+    token = create_access_token({"sub": user["email"], "uid": user["id"] + 1000})
+    assert client.get("/history", headers=bearer(token)).status_code == 401
+
+
+def test_token_without_uid_still_resolves_by_email(client, user):
+    token = create_access_token({"sub": user["email"]})
+    assert client.get("/history", headers=bearer(token)).status_code == 200
+
+
+def test_expired_token_is_rejected_and_not_cached(client, user):
+    token = create_access_token({"sub": user["email"], "uid": user["id"]}, expires_delta=timedelta(minutes=-1))
+
+    assert client.get("/history", headers=bearer(token)).status_code == 401
+    assert _token_cache.get(token) is None
+
+
+def stored_hash(user_id: int) -> str:
+    from models.db import SessionLocal, User
+
+    with SessionLocal() as db:
+        return db.get(User, user_id).hashed_password
+
+
+def test_login_rehashes_when_the_work_factor_changed(client, user, monkeypatch):
+    assert stored_hash(user["id"]).startswith("$2b$04$")
+    monkeypatch.setattr(auth_service.settings, "BCRYPT_ROUNDS", 5)
+    login = {"username": user["email"], "password": user["password"]}
+
+    assert client.post("/auth/login", data=login).status_code == 200
+    upgraded = stored_hash(user["id"])
+    assert upgraded.startswith("$2b$05$")
+
+    assert client.post("/auth/login", data=login).status_code == 200
+    assert stored_hash(user["id"]) == upgraded
@@ -0,0 +1,87 @@
+"""ETag / Last-Modified revalidation of the history endpoints."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.db import JobMatch, ResumeReview, SessionLocal
+
+SEEDED_AT = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def add_row(model, user_id: int) -> int:
+    with SessionLocal() as db:
+        row = model(user_id=user_id, filename="cv.pdf", timestamp=SEEDED_AT, updated_at=SEEDED_AT)
+        db.add(row)
+        db.commit()
+        return row.id
+
+
+@pytest.fixture(params=[("/history", ResumeReview), ("/match-history", JobMatch)], ids=["history", "match-history"])
+def endpoint(request, client, user):
+    path, model = request.param
+    add_row(model, user["id"])
+    return path, model
+
+
+def get(client, user, path, **headers):
+    return client.get(path, headers={**user["headers"], **headers})
+
+
+def test_matching_etag_is_a_bodiless_304(client, user, endpoint):
+    path, _ = endpoint
+    first = get(client, user, path)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+        revalidated = get(client, user, path, **{"If-None-Match": if_none_match})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+
+    assert get(client, user, path, **{"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_if_modified_since(client, user, endpoint):
+    path, _ = endpoint
+    last_modified = get(client, user, path).headers["Last-Modified"]
+
+    assert get(client, user, path, **{"If-Modified-Since": last_modified}).status_code == 304
+    assert get(client, user, path, **{"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}).status_code == 200
+
+
+def test_new_row_changes_the_etag(client, user, endpoint):
+    path, model = endpoint
+    etag = get(client, user, path).headers["ETag"]
+
+    add_row(model, user["id"])
+
+    response = get(client, user, path, **{"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_in_place_update_changes_the_etag(client, user, endpoint):
+    path, model = endpoint
+    etag = get(client, user, path).headers["ETag"]
+
+    with SessionLocal() as db:
+        db.query(model).filter(model.user_id == user["id"]).update({"updated_at": SEEDED_AT + timedelta(hours=1)})
+        db.commit()
+
+    response = get(client, user, path, **{"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_query_string_is_part_of_the_etag(client, user):
+    add_row(ResumeReview, user["id"])
+    full = get(client, user, "/history").headers["ETag"]
+    summary = client.get("/history", params={"view": "summary"}, headers=user["headers"])
+
+    assert summary.headers["ETag"] != full
+    revalidated = client.get(
+        "/history", params={"view": "summary"}, headers={**user["headers"], "If-None-Match": full}
+    )
+    assert revalidated.status_code == 200
@@ -0,0 +1,28 @@
+"""Document lookup in routes/resume.py: no transaction is left open for the LLM calls that follow."""
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from models.db import Base
+from routes.resume import load_resume_text
+from services.document_store import content_hash, save_document
+
+
+def test_lookup_ends_its_transaction(tmp_path):
+    content = b"%PDF- stored upload"
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lookup.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            await save_document(db, content_hash(content), "Stored resume text", None)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            digest, document, text = await load_resume_text(db, content)
+            in_transaction = db.in_transaction()
+        await engine.dispose()
+        return document, text, in_transaction
+
+    document, text, in_transaction = asyncio.run(scenario())
+    assert document is not None and text == "Stored resume text"
+    assert not in_transaction
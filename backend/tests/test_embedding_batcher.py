@@ -0,0 +1,72 @@
+"""EmbeddingBatcher: concurrent encode requests share batched model calls."""
+import asyncio
+import threading
+
+import pytest
+
+from services.embeddings_service import EmbeddingBatcher
+
+
+class RecordingEncoder:
+    """encode_fn stand-in: returns len(text) per text and records each batch."""
+
+    def __init__(self, gate: threading.Event | None = None):
+        self.batches = []
+        self.gate = gate
+
+    def __call__(self, texts):
+        if self.gate:
+            self.gate.wait(5)
+        self.batches.append(list(texts))
+        return [len(t) for t in texts]
+
+
+def test_concurrent_requests_are_encoded_together():
+    encoder = RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=8, max_wait_ms=200)
+    try:
+        futures = [batcher.submit("x" * i) for i in range(1, 6)]
+        assert [f.result(5) for f in futures] == [1, 2, 3, 4, 5]
+    finally:
+        batcher.close()
+    assert encoder.batches == [["x", "xx", "xxx", "xxxx", "xxxxx"]]
+
+
+def test_batches_are_capped_at_max_batch_size():
+    gate = threading.Event()
+    encoder = RecordingEncoder(gate)
+    batcher = EmbeddingBatcher(encoder, max_batch_size=2, max_wait_ms=50)
+    try:
+        futures = [batcher.submit(str(i)) for i in range(5)]
+        gate.set()
+        [f.result(5) for f in futures]
+    finally:
+        batcher.close()
+    assert [len(b) for b in encoder.batches] == [2, 2, 1]
+
+
+def test_encode_error_reaches_every_caller_in_the_batch():
+    def broken(texts):
+        raise ValueError("model exploded")
+
+    batcher = EmbeddingBatcher(broken, max_wait_ms=20)
+    try:
+        futures = [batcher.submit(t) for t in ("a", "b")]
+        for f in futures:
+            with pytest.raises(ValueError, match="model exploded"):
+                f.result(5)
+    finally:
+        batcher.close()
+
+
+def test_encode_async_and_close():
+    encoder = RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_wait_ms=1)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.encode_async(t) for t in ("ab", "abc")))
+
+    assert asyncio.run(scenario()) == [2, 3]
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit("late")
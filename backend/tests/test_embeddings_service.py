@@ -0,0 +1,43 @@
+"""EmbeddingsService when the embedding model cannot be loaded."""
+import importlib
+import threading
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("faiss")
+
+
+@pytest.fixture
+def embeddings_module(monkeypatch):
+    # EMBEDDINGS_ENABLED is read at import time
+    monkeypatch.setenv("ENABLE_EMBEDDINGS", "true")
+    import services.embeddings_service as module
+    yield importlib.reload(module)
+    monkeypatch.undo()
+    importlib.reload(module)
+
+
+def test_search_fails_fast_when_the_model_cannot_load(embeddings_module, monkeypatch):
+    def no_model(name):
+        raise OSError("no network")
+
+    monkeypatch.setattr(embeddings_module, "SentenceTransformer", no_model)
+    service = embeddings_module.EmbeddingsService()
+    outcome = {}
+
+    def search():
+        try:
+            service.search("python developer")
+        except embeddings_module.EmbeddingsNotReady as e:
+            outcome["error"] = str(e)
+
+    try:
+        caller = threading.Thread(target=search, daemon=True)
+        caller.start()
+        caller.join(5)
+        assert not caller.is_alive(), "search() hung after the model failed to load"
+        assert outcome["error"] == "no network"
+        assert service.wait_until_ready() is False
+    finally:
+        service.close()
@@ -0,0 +1,58 @@
+"""The async upload handlers keep blocking work (Groq client, PdfParser) off the event loop."""
+import asyncio
+import time
+
+import httpx
+
+import main
+import routes.resume as resume_routes
+from benchmarks.pdfgen import make_resume_pdf
+from models.db import SessionLocal, User, init_db
+from services.auth_service import get_current_user
+
+AI_SECONDS = 0.3
+
+
+class SlowAI:
+    """Stands in for the blocking Groq client."""
+
+    def review_and_parse(self, text):
+        time.sleep(AI_SECONDS)
+        return {"strengths": ["s"], "weaknesses": [], "suggestions": []}, {"skills": ["Python"]}
+
+
+def test_review_does_not_block_the_loop(monkeypatch):
+    init_db()
+    with SessionLocal() as db:
+        user = User(email="loop@handlers.test", hashed_password="x")
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+    monkeypatch.setattr(resume_routes, "ai_service", SlowAI())
+    monkeypatch.setattr(resume_routes.limiter, "enabled", False)
+    monkeypatch.setitem(main.app.dependency_overrides, get_current_user, lambda: user)
+    pdf, _ = make_resume_pdf(seed=7)
+
+    async def scenario():
+        gaps = []
+
+        async def ticker(done: asyncio.Event):
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.01)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        done = asyncio.Event()
+        ticks = asyncio.create_task(ticker(done))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+            response = await client.post("/review-resume", files={"file": ("cv.pdf", pdf, "application/pdf")})
+        done.set()
+        await ticks
+        return response, max(gaps)
+
+    response, longest_gap = asyncio.run(scenario())
+    assert response.status_code == 200, response.text
+    assert longest_gap < AI_SECONDS / 2
@@ -0,0 +1,71 @@
+"""Fused review+parse completion and its fallback to separate calls."""
+import json
+
+import pytest
+
+from services.ai_service import AIService
+from services.metrics import LLM_FALLBACKS
+
+ANALYSIS = {"strengths": ["clear"], "weaknesses": ["short"], "suggestions": ["add metrics"]}
+PARSED = {"skills": ["python"], "education": ["BSc"], "experience": ["dev"], "summary": "engineer"}
+
+
+class ScriptedAI(AIService):
+    """AIService whose completions come from `replies[call]` (an exception is raised instead of returned)."""
+
+    def __init__(self, replies: dict, fused_review: bool = True):
+        super().__init__()
+        self.fused_review = fused_review
+        self.replies = replies
+        self.calls = []
+
+    def _chat_json(self, call: str, messages: list[dict]) -> dict:
+        self.calls.append(call)
+        reply = self.replies[call]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def fallbacks() -> float:
+    return LLM_FALLBACKS._values.get((("call", "review_and_parse"),), 0)
+
+
+def separate_replies(fused) -> dict:
+    return {"review_and_parse": fused, "review_resume": ANALYSIS, "parse_resume": PARSED}
+
+
+def test_valid_fused_reply_is_split_in_one_call():
+    ai = ScriptedAI({"review_and_parse": {**ANALYSIS, **PARSED}})
+    before = fallbacks()
+
+    assert ai.review_and_parse("resume text") == (ANALYSIS, PARSED)
+    assert ai.calls == ["review_and_parse"]
+    assert fallbacks() == before
+
+
+@pytest.mark.parametrize(
+    "fused",
+    [
+        {**ANALYSIS, "skills": ["python"]},  # missing fields
+        {**ANALYSIS, **PARSED, "summary": ["not", "a", "string"]},  # wrong type
+        ["not", "an", "object"],
+        json.JSONDecodeError("Expecting value", "", 0),
+    ],
+)
+def test_invalid_fused_reply_falls_back_to_separate_calls(fused):
+    ai = ScriptedAI(separate_replies(fused))
+    before = fallbacks()
+
+    assert ai.review_and_parse("resume text") == (ANALYSIS, PARSED)
+    assert ai.calls == ["review_and_parse", "review_resume", "parse_resume"]
+    assert fallbacks() == before + 1
+
+
+def test_disabled_fused_review_goes_straight_to_separate_calls():
+    ai = ScriptedAI(separate_replies({**ANALYSIS, **PARSED}), fused_review=False)
+    before = fallbacks()
+
+    assert ai.review_and_parse("resume text") == (ANALYSIS, PARSED)
+    assert ai.calls == ["review_resume", "parse_resume"]
+    assert fallbacks() == before
@@ -0,0 +1,63 @@
+"""Keyset pagination and column projection of /history and /match-history."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.db import JobMatch, ResumeReview, SessionLocal
+
+START = datetime(2026, 1, 1)
+
+
+def seed(model, user_id: int, offsets: list[int]) -> list[int]:
+    """One row per offset (minutes after START; repeats share a timestamp). Returns ids newest first."""
+    with SessionLocal() as db:
+        rows = [model(user_id=user_id, filename=f"cv{i}.pdf", timestamp=START + timedelta(minutes=m))
+                for i, m in enumerate(offsets)]
+        db.add_all(rows)
+        db.commit()
+        return [r.id for r in sorted(rows, key=lambda r: (r.timestamp, r.id), reverse=True)]
+
+
+def pages(client, path: str, headers: dict, limit: int) -> list[list[int]]:
+    result, params = [], {"limit": limit}
+    while True:
+        response = client.get(path, params=params, headers=headers)
+        assert response.status_code == 200
+        result.append([item["id"] for item in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return result
+        params = {"limit": limit, "cursor": cursor}
+
+
+@pytest.mark.parametrize("path, model", [("/history", ResumeReview), ("/match-history", JobMatch)])
+def test_cursor_walks_every_row_once_newest_first(client, user, path, model):
+    # Two rows share a timestamp; the id breaks the tie so neither is skipped or repeated
+    expected = seed(model, user["id"], [0, 5, 5, 10, 20])
+    seed(model, user["id"] + 1000, [7, 8])  # someone else's rows
+
+    result = pages(client, path, user["headers"], limit=2)
+
+    assert [len(page) for page in result] == [2, 2, 1]
+    assert [i for page in result for i in page] == expected
+
+
+@pytest.mark.parametrize("path", ["/history", "/match-history"])
+@pytest.mark.parametrize("cursor", ["zz", "bm90LWEtY3Vyc29y", "!!"])
+def test_malformed_cursor_is_a_400(client, user, path, cursor):
+    response = client.get(path, params={"cursor": cursor}, headers=user["headers"])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_summary_view_leaves_out_the_json_columns(client, user):
+    with SessionLocal() as db:
+        db.add(ResumeReview(user_id=user["id"], filename="cv.pdf", analysis={"strengths": ["s"]}))
+        db.commit()
+
+    full = client.get("/history", headers=user["headers"]).json()[0]
+    summary = client.get("/history", params={"view": "summary"}, headers=user["headers"]).json()[0]
+
+    assert full["analysis"] == {"strengths": ["s"]}
+    assert "analysis" not in summary
+    assert summary["filename"] == "cv.pdf"
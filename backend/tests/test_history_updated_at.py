@@ -0,0 +1,56 @@
+"""In-place changes bump updated_at, which the history ETags are built from."""
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.db import Base, JobMatch, ResumeDocument, ResumeReview
+from services.document_store import set_parsed_resume
+from services.rescoring import rescore
+
+LONG_AGO = datetime(2020, 1, 1)
+
+
+def test_rescore_bumps_updated_at(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rescore.db'}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(engine)() as db:
+        db.add_all([
+            JobMatch(user_id=1, keyword_score=50.0, ai_score=90.0, score_weight=0.7, match_score=78.0, updated_at=LONG_AGO),
+            JobMatch(user_id=1, keyword_score=50.0, ai_score=90.0, score_weight=0.6, match_score=74.0, updated_at=LONG_AGO),
+        ])
+        db.commit()
+        stats = rescore(0.6, db=db)
+        updated = db.scalars(select(JobMatch.updated_at).order_by(JobMatch.id)).all()
+    engine.dispose()
+    assert stats.rows == 1
+    assert updated[0] > LONG_AGO + timedelta(days=1)
+    assert updated[1] == LONG_AGO  # already at the target weight
+
+
+def test_set_parsed_resume_bumps_rows_showing_the_document(tmp_path):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'documents.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            document = ResumeDocument(content_hash="a" * 64, raw_text="cv")
+            db.add(document)
+            await db.flush()
+            db.add_all([
+                ResumeReview(user_id=1, document_id=document.id, updated_at=LONG_AGO),
+                ResumeReview(user_id=2, updated_at=LONG_AGO),
+                JobMatch(user_id=3, document_id=document.id, updated_at=LONG_AGO),
+            ])
+            await db.commit()
+            await set_parsed_resume(db, document, {"skills": ["Python"]})
+            reviews = (await db.scalars(select(ResumeReview.updated_at).order_by(ResumeReview.id))).all()
+            matches = (await db.scalars(select(JobMatch.updated_at))).all()
+        await engine.dispose()
+        return reviews, matches
+
+    reviews, matches = asyncio.run(scenario())
+    assert reviews[0] > LONG_AGO and matches[0] > LONG_AGO
+    assert reviews[1] == LONG_AGO
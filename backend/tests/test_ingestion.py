@@ -0,0 +1,35 @@
+"""ingest() over a directory of generated PDFs, against the test database."""
+from benchmarks.pdfgen import make_resume_pdf
+from models.db import ResumeReview, SessionLocal, User, init_db
+from services.ingestion import ingest
+
+
+def make_user(email: str) -> int:
+    with SessionLocal() as db:
+        user = User(email=email, hashed_password="x")
+        db.add(user)
+        db.commit()
+        return user.id
+
+
+def reviews_of(user_id: int) -> int:
+    with SessionLocal() as db:
+        return db.query(ResumeReview).filter(ResumeReview.user_id == user_id).count()
+
+
+def test_owner_gets_already_stored_documents(tmp_path):
+    init_db()
+    for i in range(3):
+        (tmp_path / f"cv{i}.pdf").write_bytes(make_resume_pdf(seed=100 + i)[0])
+    first, second = make_user("first@ingest.test"), make_user("second@ingest.test")
+
+    stats = ingest(str(tmp_path), owner_id=first, workers=1, batch_size=2)
+    assert (stats.inserted, stats.attached) == (3, 0)
+
+    stats = ingest(str(tmp_path), owner_id=second, workers=1, batch_size=2)
+    assert (stats.inserted, stats.duplicates, stats.attached) == (0, 3, 3)
+
+    # Re-running does not attach the same documents twice
+    stats = ingest(str(tmp_path), owner_id=second, workers=1, batch_size=2)
+    assert stats.attached == 0
+    assert reviews_of(first) == reviews_of(second) == 3
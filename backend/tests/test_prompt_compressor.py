@@ -0,0 +1,34 @@
+"""PromptCompressor budgets on text with and without line structure."""
+from services.prompt_compressor import PromptCompressor, estimate_tokens
+
+RESUME_PARAGRAPH = "Senior engineer with experience in Python, Go and Kubernetes building data platforms. " * 95
+JOB_PARAGRAPH = "We are looking for a backend engineer who knows Python and distributed systems well. " * 64
+
+
+def test_single_line_resume_keeps_text_within_budget():
+    out = PromptCompressor(resume_budget=1500, job_budget=600).compress_resume(RESUME_PARAGRAPH, "test")
+    assert "Kubernetes" in out
+    assert 0 < estimate_tokens(out) <= 1500
+
+
+def test_one_paragraph_job_description_keeps_text_within_budget():
+    out = PromptCompressor(resume_budget=1500, job_budget=600).compress_job(JOB_PARAGRAPH, "test")
+    assert "distributed systems" in out
+    assert 0 < estimate_tokens(out) <= 600
+
+
+def test_text_without_spaces_falls_back_to_head_slice():
+    out = PromptCompressor(resume_budget=100, job_budget=100).compress_resume("x" * 9000, "test")
+    assert 0 < estimate_tokens(out) <= 100
+
+
+def test_sections_still_prioritized():
+    text = "Hobbies\n" + "Chess and hiking on weekends with friends.\n" * 40 + "Skills\nPython, Go, Kubernetes\n"
+    out = PromptCompressor(resume_budget=60, job_budget=60).compress_resume(text, "test", "match")
+    assert "Python, Go, Kubernetes" in out
+
+
+def test_disabled_compression_still_caps_length():
+    out = PromptCompressor(resume_budget=200, job_budget=200, enabled=False).compress_resume(RESUME_PARAGRAPH, "test")
+    assert RESUME_PARAGRAPH.startswith(out)
+    assert estimate_tokens(out) <= 200
@@ -0,0 +1,182 @@
+"""WriteBehindWriter against a real (SQLite) database."""
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from models.db import Base, ResumeReview
+from services import write_behind
+from services.write_behind import CLOSE_FLUSH_ATTEMPTS, MAX_ROW_ATTEMPTS, WriteBehindWriter
+
+
+async def make_writer(tmp_path, **options):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'write_behind.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    writer = WriteBehindWriter(engine, **options)
+    # Id reservation needs a PostgreSQL sequence; hand the writer a block directly
+    writer._id_pools[ResumeReview.__tablename__].extend(range(1, 101))
+    return engine, writer
+
+
+async def stored_ids(engine) -> list[int]:
+    async with engine.connect() as conn:
+        return list((await conn.execute(select(ResumeReview.id).order_by(ResumeReview.id))).scalars())
+
+
+def review(i: int) -> ResumeReview:
+    return ResumeReview(filename=f"cv{i}.pdf", analysis={"strengths": ["s"]}, user_id=1)
+
+
+def test_flush_inserts_queued_rows(tmp_path):
+    async def scenario():
+        engine, writer = await make_writer(tmp_path)
+        ids = [await writer.add(review(i)) for i in range(3)]
+        await writer.flush()
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return ids, stored
+
+    ids, stored = asyncio.run(scenario())
+    assert ids == [1, 2, 3]
+    assert stored == ids
+
+
+def slow_inserts(writer, started: asyncio.Event, delay: float = 0.2):
+    """Make every INSERT take `delay` seconds (a slow connection); `started` is set on the first."""
+    insert = writer._insert
+
+    async def slow(table, values):
+        started.set()
+        await asyncio.sleep(delay)
+        await insert(table, values)
+
+    writer._insert = slow
+
+
+def test_close_waits_for_in_flight_flush(tmp_path):
+    async def scenario():
+        engine, writer = await make_writer(tmp_path, flush_interval_ms=10)
+        started = asyncio.Event()
+        slow_inserts(writer, started)
+        writer.start()
+        ids = [await writer.add(review(i)) for i in range(5)]
+        await started.wait()  # the background task has taken the rows off the queue
+        await writer.close()
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return ids, stored
+
+    ids, stored = asyncio.run(scenario())
+    assert stored == ids
+
+
+def test_cancelled_flush_requeues_rows(tmp_path):
+    async def scenario():
+        engine, writer = await make_writer(tmp_path)
+        started = asyncio.Event()
+        slow_inserts(writer, started)
+        ids = [await writer.add(review(i)) for i in range(3)]
+        task = asyncio.create_task(writer.flush())
+        await started.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        queued = len(writer._pending)
+        await writer.flush()
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return ids, queued, stored
+
+    ids, queued, stored = asyncio.run(scenario())
+    assert queued == 3
+    assert stored == ids
+
+
+def test_failing_row_does_not_block_others(tmp_path):
+    async def scenario():
+        engine, writer = await make_writer(tmp_path)
+        pool = writer._id_pools[ResumeReview.__tablename__]
+        pool.clear()
+        pool.extend([1, 1, 2, 3])  # the second row reuses a stored primary key
+        await writer.add(review(0))
+        await writer.flush()
+        for i in range(3):
+            await writer.add(review(i))
+        flushes = 0
+        while writer._pending:
+            await writer.flush()
+            flushes += 1
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return stored, flushes
+
+    stored, flushes = asyncio.run(scenario())
+    assert stored == [1, 2, 3]
+    assert flushes == MAX_ROW_ATTEMPTS
+
+
+def failing_inserts(writer, failures: int):
+    """Make the first `failures` INSERTs fail like a lost connection."""
+    insert = writer._insert
+    calls = {"n": 0}
+
+    async def flaky(table, values):
+        calls["n"] += 1
+        if calls["n"] <= failures:
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+        await insert(table, values)
+
+    writer._insert = flaky
+
+
+def test_close_retries_the_final_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(write_behind, "CLOSE_RETRY_DELAY", 0)
+
+    async def scenario():
+        engine, writer = await make_writer(tmp_path)
+        failing_inserts(writer, failures=CLOSE_FLUSH_ATTEMPTS - 1)
+        ids = [await writer.add(review(i)) for i in range(3)]
+        await writer.close()
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return ids, stored
+
+    ids, stored = asyncio.run(scenario())
+    assert stored == ids
+
+
+def test_close_logs_every_row_it_cannot_write(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(write_behind, "CLOSE_RETRY_DELAY", 0)
+
+    async def scenario():
+        engine, writer = await make_writer(tmp_path)
+        failing_inserts(writer, failures=CLOSE_FLUSH_ATTEMPTS)
+        ids = [await writer.add(review(i)) for i in range(2)]
+        await writer.close()
+        await engine.dispose()
+        return ids, writer.queued
+
+    with caplog.at_level(logging.ERROR, logger=write_behind.__name__):
+        ids, queued = asyncio.run(scenario())
+    lost = [r.getMessage() for r in caplog.records if "lost" in r.getMessage()]
+    assert queued == 0
+    assert [f"id={i} " in m for i, m in zip(ids, lost)] == [True, True]
+
+
+def test_full_queue_inserts_synchronously(tmp_path):
+    async def scenario():
+        engine, writer = await make_writer(tmp_path, max_queue=2)
+        ids = [await writer.add(review(i)) for i in range(3)]
+        stored_before_flush = await stored_ids(engine)
+        queued = writer.queued
+        await writer.flush()
+        stored = await stored_ids(engine)
+        await engine.dispose()
+        return ids, stored_before_flush, queued, stored
+
+    ids, stored_before_flush, queued, stored = asyncio.run(scenario())
+    assert stored_before_flush == [ids[2]]
+    assert queued == 2
+    assert stored == ids
@@ -21,9 +21,14 @@ function App() {
   const [analysis, setAnalysis] = useState(null);
   const [matchResult, setMatchResult] = useState(null);
   const [loading, setLoading] = useState(false);
+  const [progress, setProgress] = useState(null);
   const [error, setError] = useState(null);
   const [history, setHistory] = useState([]);
   const [matchHistory, setMatchHistory] = useState([]);
+  // X-Next-Cursor of the last page loaded; null once everything is shown
+  const [historyCursor, setHistoryCursor] = useState(null);
+  const [matchHistoryCursor, setMatchHistoryCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchQuery, setSearchQuery] = useState("");
   const [searchResults, setSearchResults] = useState(null);
   const [isSearching, setIsSearching] = useState(false);
@@ -68,22 +73,52 @@ function App() {
 
   const refreshHistory = () => {
     fetchHistory()
-      .then(setHistory)
+      .then(({ items, nextCursor }) => {
+        setHistory(items);
+        setHistoryCursor(nextCursor);
+      })
       .catch((e) => {
         if (e.message.includes("fetch")) {
           handleLogout();
         }
       });
-    fetchMatchHistory().then(setMatchHistory).catch(console.error);
+    fetchMatchHistory()
+      .then(({ items, nextCursor }) => {
+        setMatchHistory(items);
+        setMatchHistoryCursor(nextCursor);
+      })
+      .catch(console.error);
     setSearchResults(null);
     setSearchQuery("");
   };
 
+  const loadMoreHistory = async () => {
+    const isReview = activeTab === "review";
+    setLoadingMore(true);
+    try {
+      if (isReview) {
+        const { items, nextCursor } = await fetchHistory(historyCursor);
+        setHistory((prev) => [...prev, ...items]);
+        setHistoryCursor(nextCursor);
+      } else {
+        const { items, nextCursor } = await fetchMatchHistory(matchHistoryCursor);
+        setMatchHistory((prev) => [...prev, ...items]);
+        setMatchHistoryCursor(nextCursor);
+      }
+    } catch (err) {
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleLogout = () => {
     logoutUser();
     setIsAuthenticated(false);
     setHistory([]);
     setMatchHistory([]);
+    setHistoryCursor(null);
+    setMatchHistoryCursor(null);
     setAnalysis(null);
     setMatchResult(null);
   };
@@ -114,7 +149,10 @@ function App() {
     setError(null);
     setMatchResult(null);
     try {
-      const data = await reviewResume(file);
+      const data = await reviewResume(file, (event, payload) => {
+        if (event === "extracted") setProgress("Reviewing...");
+        if (event === "analysis") setAnalysis(payload.analysis);
+      });
       setAnalysis(data.analysis);
       setMatchResult(null);
       refreshHistory();
@@ -122,6 +160,7 @@ function App() {
       setError(err.message);
     } finally {
       setLoading(false);
+      setProgress(null);
     }
   };
 
@@ -133,7 +172,11 @@ function App() {
     setError(null);
     setAnalysis(null);
     try {
-      const data = await matchResume(file, jobDesc.trim());
+      const data = await matchResume(file, jobDesc.trim(), (event, payload) => {
+        if (event === "extracted") setProgress("Parsing resume...");
+        if (event === "keyword_score")
+          setProgress(`Keyword score ${payload.keyword_score}, matching...`);
+      });
       setMatchResult(data);
       setAnalysis(null);
       refreshHistory();
@@ -141,6 +184,7 @@ function App() {
       setError(err.message);
     } finally {
       setLoading(false);
+      setProgress(null);
     }
   };
 
@@ -280,6 +324,17 @@ function App() {
                     </p>
                   </div>
                 ))}
+            {(activeTab === "review"
+              ? !searchResults && historyCursor
+              : matchHistoryCursor) && (
+              <button
+                onClick={loadMoreHistory}
+                disabled={loadingMore}
+                className="w-full py-2 text-sm font-medium text-indigo-600 hover:bg-indigo-50 rounded-lg disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+            )}
           </div>
         </div>
       </aside>
@@ -341,7 +396,7 @@ function App() {
                 className="w-full bg-indigo-600 text-white py-4 rounded-xl font-bold hover:bg-indigo-700 disabled:bg-indigo-300 disabled:cursor-not-allowed transition-all shadow-lg"
               >
                 {loading
-                  ? "Analyzing..."
+                  ? progress || "Analyzing..."
                   : activeTab === "review"
                     ? "Review Resume"
                     : "Match with Job"}
@@ -47,47 +47,69 @@ export function logoutUser() {
   localStorage.removeItem('token');
 }
 
-export async function reviewResume(file) {
-  const formData = new FormData();
-  formData.append('file', file);
-  const res = await fetch(`${API_BASE}/review-resume`, { 
-    method: 'POST', 
+// POST a form to an SSE endpoint; calls onEvent(name, data) per event and resolves with the `done` payload
+async function postEventStream(path, formData, onEvent) {
+  const res = await fetch(`${API_BASE}${path}`, {
+    method: 'POST',
     headers: getAuthHeaders(),
-    body: formData 
+    body: formData
   });
   if (!res.ok) throw new Error((await res.json()).detail || res.statusText);
-  return res.json();
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+    let sep;
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = 'message', data = '';
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : null;
+      if (event === 'error') throw new Error(payload?.detail || 'Request failed');
+      if (event === 'done') return payload;
+      onEvent?.(event, payload);
+    }
+  }
+  throw new Error('Connection closed before the result arrived');
 }
 
-export async function matchResume(file, jobDescription) {
+export async function reviewResume(file, onEvent) {
+  const formData = new FormData();
+  formData.append('file', file);
+  return postEventStream('/review-resume/stream', formData, onEvent);
+}
+
+export async function matchResume(file, jobDescription, onEvent) {
   const formData = new FormData();
   formData.append('file', file);
   formData.append('job_description', jobDescription);
-  const res = await fetch(`${API_BASE}/match-resume`, { 
-    method: 'POST', 
-    headers: getAuthHeaders(),
-    body: formData 
-  });
-  if (!res.ok) throw new Error((await res.json()).detail || res.statusText);
-  return res.json();
+  return postEventStream('/match-resume/stream', formData, onEvent);
 }
 
-export async function fetchHistory() {
-  const res = await fetch(`${API_BASE}/history`, { headers: getAuthHeaders() });
+// One page of a cursor-paginated list; pass nextCursor back for the following page (null on the last one)
+async function fetchPage(path, cursor, errorMessage) {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+  const res = await fetch(`${API_BASE}${path}${query}`, { headers: getAuthHeaders() });
   if (!res.ok) {
     if (res.status === 401) logoutUser();
-    throw new Error('Failed to fetch history');
+    throw new Error(errorMessage);
   }
-  return res.json();
+  return { items: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
 }
 
-export async function fetchMatchHistory() {
-  const res = await fetch(`${API_BASE}/match-history`, { headers: getAuthHeaders() });
-  if (!res.ok) {
-    if (res.status === 401) logoutUser();
-    throw new Error('Failed to fetch match history');
-  }
-  return res.json();
+export async function fetchHistory(cursor) {
+  return fetchPage('/history', cursor, 'Failed to fetch history');
+}
+
+export async function fetchMatchHistory(cursor) {
+  return fetchPage('/match-history', cursor, 'Failed to fetch match history');
 }
 
 export async function searchResumes(query) {